@@ -8,6 +8,9 @@ import boto3
 import json
 import logging
 import os
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from decimal import Decimal
 from pathlib import Path
@@ -108,11 +111,21 @@ class CustomerAnalyticsManager:
 
     def __init__(self, region: str = "us-east-1"):
         self.region = region
-        self.ddb = boto3.resource("dynamodb", region_name=region)
         self.s3 = boto3.client("s3", region_name=region)
         self.bedrock = boto3.client("bedrock-runtime", region_name=region)
 
-        self.table = self.ddb.Table(TABLE_CHATBOT)
+        self._table_name = TABLE_CHATBOT
+        self._local = threading.local()
+
+    @property
+    def table(self):
+        """스레드별 DynamoDB Table (매니저는 세션 간 공유되고 boto3 resource는 스레드 안전하지 않음)"""
+        table = getattr(self._local, "table", None)
+        if table is None:
+            session = boto3.session.Session()
+            table = session.resource("dynamodb", region_name=self.region).Table(self._table_name)
+            self._local.table = table
+        return table
 
     # ─── 사용자 목록 ─────────────────────────────────────────────
 
@@ -157,28 +170,9 @@ class CustomerAnalyticsManager:
 
         # 2) 대화이력 (main table query, SK begins_with CONV#)
         try:
-            resp = self.table.query(
-                KeyConditionExpression="PK = :pk AND begins_with(SK, :prefix)",
-                ExpressionAttributeValues={":pk": pk, ":prefix": "CONV#"},
-                ScanIndexForward=False,
-            )
-            convs = [self._convert_decimals(i) for i in resp.get("Items", [])]
+            convs = self._query_conversations(pk)
             data["conversations"] = convs
-            data["conversation_count"] = len(convs)
-
-            # 캐릭터별 대화 수
-            char_counts = {}
-            sentiments = {"positive": 0, "neutral": 0, "negative": 0}
-            all_keywords = []
-            for c in convs:
-                char = c.get("character", "unknown")
-                char_counts[char] = char_counts.get(char, 0) + 1
-                sentiment = c.get("user_sentiment", "neutral")
-                sentiments[sentiment] = sentiments.get(sentiment, 0) + 1
-                all_keywords.extend(c.get("keywords", []))
-            data["character_chat_counts"] = char_counts
-            data["sentiment_distribution"] = sentiments
-            data["top_keywords"] = self._top_n(all_keywords, 10)
+            data.update(self._conversation_stats(convs))
         except Exception as e:
             logger.error("대화이력 조회 오류: %s", e)
             data["conversations"] = []
@@ -216,16 +210,21 @@ class CustomerAnalyticsManager:
                 reverse=True,
             )[:5]
 
-            recent_logs = []
-            for key in keys:
+            def _fetch_log(key: str) -> Dict[str, Any]:
                 obj = self.s3.get_object(Bucket=BUCKET_NAME, Key=key)
                 log = json.loads(obj["Body"].read())
-                recent_logs.append({
+                return {
                     "character": log.get("character", ""),
                     "session_start": log.get("session_start", ""),
                     "message_count": log.get("message_count", 0),
                     "messages": log.get("messages", [])[-6:],  # 최근 6개 메시지만
-                })
+                }
+
+            # 로그 객체 GET은 서로 독립 → 동시 실행 (map이라 최신순 유지)
+            recent_logs = []
+            if keys:
+                with ThreadPoolExecutor(max_workers=len(keys)) as executor:
+                    recent_logs = list(executor.map(_fetch_log, keys))
             data["recent_logs"] = recent_logs
         except Exception as e:
             logger.error("S3 로그 조회 오류: %s", e)
@@ -233,6 +232,68 @@ class CustomerAnalyticsManager:
 
         return data
 
+    # ─── 사용자 일괄 집계 ─────────────────────────────────────────
+
+    def batch_get_conversation_stats(
+        self, user_ids: List[str], max_workers: int = 16
+    ) -> Dict[str, Dict[str, Any]]:
+        """여러 사용자의 대화 통계만 일괄 조회 (프로필/메모리/S3 로그 생략)
+
+        CONV#은 begins_with 범위 조회라 BatchGetItem 대상이 아니므로 사용자별 query를 동시 실행
+        """
+        def _fetch(user_id: str) -> Dict[str, Any]:
+            try:
+                return self._conversation_stats(self._query_conversations(f"USER#{user_id}"))
+            except Exception as e:
+                logger.error("대화이력 조회 오류 (%s): %s", user_id, e)
+                return {"conversation_count": 0}
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return dict(zip(user_ids, executor.map(_fetch, user_ids)))
+
+    def get_users_aggregate_counts(
+        self, user_ids: List[str], max_workers: int = 16
+    ) -> Dict[str, Any]:
+        """여러 사용자의 대화 통계 합산 (총 대화 수 / 캐릭터별 대화 수 / 감정 분포)"""
+        per_user = self.batch_get_conversation_stats(user_ids, max_workers).values()
+        char_total_counts = Counter()
+        sentiment_total = Counter({"positive": 0, "neutral": 0, "negative": 0})
+        for stats in per_user:
+            char_total_counts.update(stats.get("character_chat_counts", {}))
+            sentiment_total.update(stats.get("sentiment_distribution", {}))
+        return {
+            "total_conversations": sum(s.get("conversation_count", 0) for s in per_user),
+            "character_counts": dict(char_total_counts),
+            "sentiment_total": dict(sentiment_total),
+        }
+
+    def _query_conversations(self, pk: str) -> List[Dict[str, Any]]:
+        resp = self.table.query(
+            KeyConditionExpression="PK = :pk AND begins_with(SK, :prefix)",
+            ExpressionAttributeValues={":pk": pk, ":prefix": "CONV#"},
+            ScanIndexForward=False,
+        )
+        return [self._convert_decimals(i) for i in resp.get("Items", [])]
+
+    @classmethod
+    def _conversation_stats(cls, convs: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """대화 목록 → 대화 수 / 캐릭터별 대화 수 / 감정 분포 / 상위 키워드"""
+        char_counts = {}
+        sentiments = {"positive": 0, "neutral": 0, "negative": 0}
+        all_keywords = []
+        for c in convs:
+            char = c.get("character", "unknown")
+            char_counts[char] = char_counts.get(char, 0) + 1
+            sentiment = c.get("user_sentiment", "neutral")
+            sentiments[sentiment] = sentiments.get(sentiment, 0) + 1
+            all_keywords.extend(c.get("keywords", []))
+        return {
+            "conversation_count": len(convs),
+            "character_chat_counts": char_counts,
+            "sentiment_distribution": sentiments,
+            "top_keywords": cls._top_n(all_keywords, 10),
+        }
+
     # ─── AI 분석 ─────────────────────────────────────────────────
 
     def analyze_preferences(self, user_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -357,7 +418,6 @@ class CustomerAnalyticsManager:
     @staticmethod
     def _top_n(items: list, n: int) -> list:
         """빈도순 상위 N개"""
-        from collections import Counter
         return [item for item, _ in Counter(items).most_common(n)]
 
     @staticmethod
@@ -7,6 +7,7 @@ AdminDataManager: DDB/S3 CRUD + KB 동기화
 import boto3
 import json
 import logging
+import threading
 import uuid
 from datetime import datetime, timezone
 from decimal import Decimal
@@ -37,13 +38,24 @@ class AdminDataManager:
         self.bedrock_agent = boto3.client("bedrock-agent", region_name=region)
 
         tables = cfg.get("dynamodb_tables", {})
-        self.table = self.ddb.Table(tables.get("chatbot", "character_chatbot"))
+        self._table_name = tables.get("chatbot", "character_chatbot")
+        self._local = threading.local()
 
         self.bucket_name = cfg.get("bucket_name", "")
         self.kb_id = cfg.get("knowledge_base_id", "")
         self.content_ds_id = cfg.get("content_data_source_id", "")
         self.content_data_prefix = cfg.get("content_data_prefix", "content-data/")
 
+    @property
+    def table(self):
+        """스레드별 DynamoDB Table (매니저는 세션 간 공유되고 boto3 resource는 스레드 안전하지 않음)"""
+        table = getattr(self._local, "table", None)
+        if table is None:
+            session = boto3.session.Session()
+            table = session.resource("dynamodb", region_name=self.region).Table(self._table_name)
+            self._local.table = table
+        return table
+
     # ─── 콘텐츠 CRUD ────────────────────────────────────────────────
 
     def create_content(self, content_data: Dict[str, Any]) -> str:
@@ -76,15 +76,16 @@ class KPopDemonHuntersChatbot:
         # 현재 디렉토리
         self.current_dir = Path(__file__).parent
 
-        # 이미지 CDN URL (CloudFront) — chatbot_config.json 또는 환경변수에서 로드
-        self.image_cdn_url = os.environ.get("IMAGE_CDN_URL", "")
-        if not self.image_cdn_url:
-            try:
-                with open(self.current_dir / "chatbot_config.json", "r", encoding="utf-8") as _cf:
-                    _chatbot_cfg = json.load(_cf)
-                    self.image_cdn_url = _chatbot_cfg.get("image_cdn_url", "")
-            except (FileNotFoundError, json.JSONDecodeError):
-                pass
+        # 이미지 CDN URL (CloudFront) — 환경변수 또는 chatbot_config.json에서 로드
+        _chatbot_cfg = {}
+        try:
+            with open(self.current_dir / "chatbot_config.json", "r", encoding="utf-8") as _cf:
+                _chatbot_cfg = json.load(_cf)
+        except (FileNotFoundError, json.JSONDecodeError):
+            pass
+        self.image_cdn_url = os.environ.get("IMAGE_CDN_URL", "") or _chatbot_cfg.get("image_cdn_url", "")
+        # upload_images.py --webp 로 변환 업로드된 이미지 파일명 매핑 ("폴더/원본" → WebP 파일명)
+        self._image_webp_map = _chatbot_cfg.get("emotion_image_webp", {})
         # 끝의 / 제거
         self.image_cdn_url = self.image_cdn_url.rstrip("/")
 
@@ -198,10 +199,13 @@ class KPopDemonHuntersChatbot:
         if not file_map:
             return []
         base = f"{self.image_cdn_url}/emotion-images/{folder_name}"
-        urls = [f"{base}/{file_map['default']}"]
+        webp_map = self._image_webp_map
+        default_file = file_map["default"]
+        urls = [f"{base}/{webp_map.get(f'{folder_name}/{default_file}', default_file)}"]
         for emotion in self.emotion_names:
             filename = file_map["emotions"].get(emotion)
             if filename:
+                filename = webp_map.get(f"{folder_name}/{filename}", filename)
                 # URL 인코딩 (공백 등)
                 encoded = filename.replace(" ", "%20")
                 urls.append(f"{base}/{encoded}")
@@ -8,10 +8,18 @@ ECS Fargate + ALB + CloudFront 인프라 구축
 """
 
 import boto3
+import hashlib
 import json
+import os
+import threading
 import time
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
+from string import Template
+
+from botocore.config import Config
 
 REGION = "us-east-1"
 CLUSTER_NAME = "character-chatbot-cluster"
@@ -20,6 +28,7 @@ TASK_FAMILY = "character-chatbot-task"
 ECR_REPO_NAME = "character-chatbot"
 CONTAINER_NAME = "chatbot"
 CONTAINER_PORT = 8501
+TASK_DEF_HASH_LABEL = "chatbot.task-def-hash"
 
 ALB_NAME = "chatbot-alb"
 TG_NAME = "chatbot-tg"
@@ -30,14 +39,92 @@ EXECUTION_ROLE_NAME = "chatbot-ecs-execution-role"
 
 APP_CF_COMMENT = "Character Chatbot App CDN"
 
+# admin_config.json은 프로세스당 1회만 읽고, 변경 사항은 save_infra_config에서 한 번에 저장
+CONFIG_PATH = Path(__file__).resolve().parent.parent / "admin_config.json"
+try:
+    _CFG = json.loads(CONFIG_PATH.read_text(encoding="utf-8")) if CONFIG_PATH.exists() else {}
+except json.JSONDecodeError as e:
+    # 빈 dict로 대체하면 이후 저장 시 기존 설정(bucket_name, Cognito ID 등)을 덮어써 유실되므로 중단
+    sys.exit(f"Error: {CONFIG_PATH} is not valid JSON ({e}). Fix the file and re-run.")
+
+# IAM 정책 문서 — 모듈 로드 시 1회 직렬화 ($변수는 string.Template 치환)
+_TRUST_POLICY = json.dumps({
+    "Version": "2012-10-17",
+    "Statement": [{"Effect": "Allow", "Principal": {"Service": "ecs-tasks.amazonaws.com"}, "Action": "sts:AssumeRole"}],
+})
+_TASK_POLICY_TMPL = Template(json.dumps({
+    "Version": "2012-10-17",
+    "Statement": [
+        {
+            "Effect": "Allow",
+            "Action": ["bedrock:InvokeModel", "bedrock:InvokeModelWithResponseStream"],
+            "Resource": "*",
+        },
+        {
+            "Effect": "Allow",
+            "Action": ["bedrock:Retrieve"],
+            "Resource": "arn:aws:bedrock:$region:$account_id:knowledge-base/*",
+        },
+        {
+            "Effect": "Allow",
+            "Action": ["s3:GetObject", "s3:ListBucket", "s3:PutObject"],
+            "Resource": [
+                "arn:aws:s3:::$bucket_name",
+                "arn:aws:s3:::$bucket_name/*",
+            ],
+        },
+        {
+            "Effect": "Allow",
+            "Action": ["dynamodb:GetItem", "dynamodb:PutItem", "dynamodb:UpdateItem",
+                       "dynamodb:DeleteItem", "dynamodb:Query", "dynamodb:Scan"],
+            "Resource": [
+                "arn:aws:dynamodb:$region:$account_id:table/character_chatbot",
+                "arn:aws:dynamodb:$region:$account_id:table/character_chatbot/index/*",
+            ],
+        },
+        {
+            "Effect": "Allow",
+            "Action": ["cognito-idp:AdminGetUser", "cognito-idp:ListUsers"],
+            "Resource": "arn:aws:cognito-idp:$region:$account_id:userpool/*",
+        },
+    ],
+}))
+
+# 모든 헬퍼가 공유하는 단일 Session (엔드포인트 해석 / HTTPS 커넥션 풀 재사용)
+session = boto3.session.Session(region_name=REGION)
+CLIENT_CONFIG = Config(
+    retries={"mode": "adaptive", "max_attempts": 10},
+    max_pool_connections=64,
+    tcp_keepalive=True,
+)
+_client_lock = threading.Lock()
+
+
+@lru_cache(maxsize=None)
+def _client(service: str):
+    """서비스별 클라이언트 1회 생성 후 재사용 (클라이언트는 스레드 안전, Session.client는 아님)"""
+    with _client_lock:
+        return session.client(service, config=CLIENT_CONFIG)
+
+
+@lru_cache(maxsize=None)
+def _role_arn(account_id: str, role_name: str) -> str:
+    return f"arn:aws:iam::{account_id}:role/{role_name}"
+
+
+@lru_cache(maxsize=None)
+def _ecr_image_uri(account_id: str) -> str:
+    return f"{account_id}.dkr.ecr.{REGION}.amazonaws.com/{ECR_REPO_NAME}:latest"
+
 
+@lru_cache(maxsize=1)
 def get_account_id() -> str:
-    return boto3.client("sts", region_name=REGION).get_caller_identity()["Account"]
+    return _client("sts").get_caller_identity()["Account"]
 
 
 def get_default_vpc_and_subnets():
     """기본 VPC와 퍼블릭 서브넷 조회"""
-    ec2 = boto3.client("ec2", region_name=REGION)
+    ec2 = _client("ec2")
 
     vpcs = ec2.describe_vpcs(Filters=[{"Name": "is-default", "Values": ["true"]}])["Vpcs"]
     if not vpcs:
@@ -57,7 +144,7 @@ def get_default_vpc_and_subnets():
 
 def create_security_groups(vpc_id: str):
     """ALB용 + ECS Task용 보안 그룹 생성"""
-    ec2 = boto3.client("ec2", region_name=REGION)
+    ec2 = _client("ec2")
 
     # 기존 SG 검색
     existing = ec2.describe_security_groups(
@@ -105,28 +192,25 @@ def create_security_groups(vpc_id: str):
 def create_iam_roles(account_id: str, bucket_name: str = ""):
     """ECS Task Role + Execution Role 생성"""
     if not bucket_name:
-        import os as _os
-        bucket_name = _os.environ.get("S3_BUCKET_NAME", "")
-        if not bucket_name:
-            try:
-                with open(Path(__file__).resolve().parent.parent / "admin_config.json", "r") as f:
-                    bucket_name = json.load(f).get("bucket_name", "")
-            except (FileNotFoundError, json.JSONDecodeError):
-                pass
-    iam = boto3.client("iam", region_name=REGION)
+        bucket_name = os.environ.get("S3_BUCKET_NAME", "") or _CFG.get("bucket_name", "")
+    iam = _client("iam")
+
+    # 기존 Role 일괄 조회 (역할 수와 무관하게 페이지 단위 호출)
+    paginator = iam.get_paginator("get_account_authorization_details")
+    existing = {
+        role["RoleName"]
+        for page in paginator.paginate(Filter=["Role"])
+        for role in page["RoleDetailList"]
+    }
 
     # Task Execution Role (ECR pull + CloudWatch logs)
-    execution_role_arn = f"arn:aws:iam::{account_id}:role/{EXECUTION_ROLE_NAME}"
-    try:
-        iam.get_role(RoleName=EXECUTION_ROLE_NAME)
+    execution_role_arn = _role_arn(account_id, EXECUTION_ROLE_NAME)
+    if EXECUTION_ROLE_NAME in existing:
         print(f"  Execution role already exists: {execution_role_arn}")
-    except iam.exceptions.NoSuchEntityException:
+    else:
         iam.create_role(
             RoleName=EXECUTION_ROLE_NAME,
-            AssumeRolePolicyDocument=json.dumps({
-                "Version": "2012-10-17",
-                "Statement": [{"Effect": "Allow", "Principal": {"Service": "ecs-tasks.amazonaws.com"}, "Action": "sts:AssumeRole"}],
-            }),
+            AssumeRolePolicyDocument=_TRUST_POLICY,
         )
         iam.attach_role_policy(
             RoleName=EXECUTION_ROLE_NAME,
@@ -135,59 +219,21 @@ def create_iam_roles(account_id: str, bucket_name: str = ""):
         print(f"  Created execution role: {execution_role_arn}")
 
     # Task Role (Bedrock, S3, DDB, Cognito)
-    task_role_arn = f"arn:aws:iam::{account_id}:role/{TASK_ROLE_NAME}"
-    try:
-        iam.get_role(RoleName=TASK_ROLE_NAME)
+    task_role_arn = _role_arn(account_id, TASK_ROLE_NAME)
+    if TASK_ROLE_NAME in existing:
         print(f"  Task role already exists: {task_role_arn}")
-    except iam.exceptions.NoSuchEntityException:
+    else:
         iam.create_role(
             RoleName=TASK_ROLE_NAME,
-            AssumeRolePolicyDocument=json.dumps({
-                "Version": "2012-10-17",
-                "Statement": [{"Effect": "Allow", "Principal": {"Service": "ecs-tasks.amazonaws.com"}, "Action": "sts:AssumeRole"}],
-            }),
+            AssumeRolePolicyDocument=_TRUST_POLICY,
         )
         # Inline policy for Bedrock, S3, DDB, Cognito
         iam.put_role_policy(
             RoleName=TASK_ROLE_NAME,
             PolicyName="chatbot-task-policy",
-            PolicyDocument=json.dumps({
-                "Version": "2012-10-17",
-                "Statement": [
-                    {
-                        "Effect": "Allow",
-                        "Action": ["bedrock:InvokeModel", "bedrock:InvokeModelWithResponseStream"],
-                        "Resource": "*",
-                    },
-                    {
-                        "Effect": "Allow",
-                        "Action": ["bedrock:Retrieve"],
-                        "Resource": f"arn:aws:bedrock:{REGION}:{account_id}:knowledge-base/*",
-                    },
-                    {
-                        "Effect": "Allow",
-                        "Action": ["s3:GetObject", "s3:ListBucket", "s3:PutObject"],
-                        "Resource": [
-                            f"arn:aws:s3:::{bucket_name}",
-                            f"arn:aws:s3:::{bucket_name}/*",
-                        ],
-                    },
-                    {
-                        "Effect": "Allow",
-                        "Action": ["dynamodb:GetItem", "dynamodb:PutItem", "dynamodb:UpdateItem",
-                                   "dynamodb:DeleteItem", "dynamodb:Query", "dynamodb:Scan"],
-                        "Resource": [
-                            f"arn:aws:dynamodb:{REGION}:{account_id}:table/character_chatbot",
-                            f"arn:aws:dynamodb:{REGION}:{account_id}:table/character_chatbot/index/*",
-                        ],
-                    },
-                    {
-                        "Effect": "Allow",
-                        "Action": ["cognito-idp:AdminGetUser", "cognito-idp:ListUsers"],
-                        "Resource": f"arn:aws:cognito-idp:{REGION}:{account_id}:userpool/*",
-                    },
-                ],
-            }),
+            PolicyDocument=_TASK_POLICY_TMPL.substitute(
+                bucket_name=bucket_name, account_id=account_id, region=REGION,
+            ),
         )
         print(f"  Created task role: {task_role_arn}")
 
@@ -196,7 +242,7 @@ def create_iam_roles(account_id: str, bucket_name: str = ""):
 
 def create_log_group():
     """CloudWatch Logs 그룹 생성"""
-    logs = boto3.client("logs", region_name=REGION)
+    logs = _client("logs")
     log_group = f"/ecs/{TASK_FAMILY}"
     try:
         logs.create_log_group(logGroupName=log_group)
@@ -209,33 +255,26 @@ def create_log_group():
 
 def create_alb(subnet_ids: list, alb_sg_id: str, vpc_id: str):
     """ALB + Target Group 생성"""
-    elbv2 = boto3.client("elbv2", region_name=REGION)
-
-    # 기존 ALB 확인
-    albs = elbv2.describe_load_balancers()["LoadBalancers"]
-    for alb in albs:
-        if alb["LoadBalancerName"] == ALB_NAME:
-            alb_arn = alb["LoadBalancerArn"]
-            alb_dns = alb["DNSName"]
-            print(f"  ALB already exists: {alb_dns}")
-
-            # TG 확인
-            tgs = elbv2.describe_target_groups()["TargetGroups"]
-            tg_arn = None
-            for tg in tgs:
-                if tg["TargetGroupName"] == TG_NAME:
-                    tg_arn = tg["TargetGroupArn"]
-                    break
+    elbv2 = _client("elbv2")
+
+    # 기존 ALB 확인 (이름으로 직접 조회)
+    try:
+        alb = elbv2.describe_load_balancers(Names=[ALB_NAME])["LoadBalancers"][0]
+    except elbv2.exceptions.LoadBalancerNotFoundException:
+        alb = None
+
+    if alb:
+        alb_arn = alb["LoadBalancerArn"]
+        alb_dns = alb["DNSName"]
+        print(f"  ALB already exists: {alb_dns}")
 
-            # 리스너 존재 확인 — 없으면 보안 리스너 생성 (403 default + CF header rule)
-            listeners = elbv2.describe_listeners(LoadBalancerArn=alb_arn)["Listeners"]
-            if not listeners and tg_arn:
-                _create_secure_listener(elbv2, alb_arn, tg_arn)
-                print("  Recreated HTTP:80 listener (default=403, CF header rule)")
-            else:
-                print(f"  Listener OK ({len(listeners)} listener(s))")
+        # TG 확인
+        try:
+            tg_arn = elbv2.describe_target_groups(Names=[TG_NAME])["TargetGroups"][0]["TargetGroupArn"]
+        except elbv2.exceptions.TargetGroupNotFoundException:
+            tg_arn = None
 
-            return alb_arn, alb_dns, tg_arn
+        return alb_arn, alb_dns, tg_arn
 
     # Target Group 생성
     tg_resp = elbv2.create_target_group(
@@ -277,30 +316,30 @@ def create_alb(subnet_ids: list, alb_sg_id: str, vpc_id: str):
     alb_dns = alb_resp["LoadBalancers"][0]["DNSName"]
     print(f"  Created ALB: {alb_dns}")
 
-    # ALB 준비 대기
+    return alb_arn, alb_dns, tg_arn
+
+
+def _wait_alb(alb_arn: str, tg_arn: str):
+    """ALB active 대기 후 리스너 확인 — 없으면 보안 리스너 생성 (403 default + CF header rule)
+
+    ECS 서비스 생성만 ALB에 의존하므로 백그라운드에서 실행하고 create_ecs_service 직전에 join.
+    """
+    elbv2 = _client("elbv2")
     print("  Waiting for ALB to become active...")
     waiter = elbv2.get_waiter("load_balancer_available")
     waiter.wait(LoadBalancerArns=[alb_arn])
 
-    # HTTP:80 리스너 (보안: 403 default + CF header rule)
-    _create_secure_listener(elbv2, alb_arn, tg_arn)
-    print("  Created HTTP:80 listener (default=403, CF header rule)")
-
-    return alb_arn, alb_dns, tg_arn
+    listeners = elbv2.describe_listeners(LoadBalancerArn=alb_arn)["Listeners"]
+    if not listeners and tg_arn:
+        _create_secure_listener(elbv2, alb_arn, tg_arn)
+        print("  Created HTTP:80 listener (default=403, CF header rule)")
+    else:
+        print(f"  Listener OK ({len(listeners)} listener(s))")
 
 
 def _create_secure_listener(elbv2, alb_arn: str, tg_arn: str):
     """ALB 리스너 생성: 기본 403 + X-CF-Secret 헤더 매칭 시에만 forward"""
-    import os as _os
-    cf_secret = _os.environ.get("CF_ALB_SECRET", "")
-    if not cf_secret:
-        # config에서 시도
-        try:
-            config_path = Path(__file__).resolve().parent.parent / "admin_config.json"
-            with open(config_path, "r") as f:
-                cf_secret = json.load(f).get("cf_alb_secret", "")
-        except (FileNotFoundError, json.JSONDecodeError):
-            pass
+    cf_secret = os.environ.get("CF_ALB_SECRET", "") or _CFG.get("cf_alb_secret", "")
     if not cf_secret:
         print("  WARNING: CF_ALB_SECRET not set. Creating plain forward listener.")
         elbv2.create_listener(
@@ -344,7 +383,7 @@ def _create_secure_listener(elbv2, alb_arn: str, tg_arn: str):
 
 def create_ecs_cluster():
     """ECS 클러스터 생성"""
-    ecs = boto3.client("ecs", region_name=REGION)
+    ecs = _client("ecs")
     try:
         resp = ecs.describe_clusters(clusters=[CLUSTER_NAME])
         active = [c for c in resp["clusters"] if c["status"] == "ACTIVE"]
@@ -361,22 +400,21 @@ def create_ecs_cluster():
 
 
 def register_task_definition(account_id: str, execution_role_arn: str, task_role_arn: str, log_group: str):
-    """ECS Task Definition 등록"""
-    ecs = boto3.client("ecs", region_name=REGION)
-    ecr_uri = f"{account_id}.dkr.ecr.{REGION}.amazonaws.com/{ECR_REPO_NAME}:latest"
-
-    resp = ecs.register_task_definition(
-        family=TASK_FAMILY,
-        networkMode="awsvpc",
-        requiresCompatibilities=["FARGATE"],
-        cpu="512",
-        memory="1024",
-        executionRoleArn=execution_role_arn,
-        taskRoleArn=task_role_arn,
-        containerDefinitions=[
+    """ECS Task Definition 등록 (내용이 같으면 기존 리비전 재사용)"""
+    ecs = _client("ecs")
+
+    task_def = {
+        "family": TASK_FAMILY,
+        "networkMode": "awsvpc",
+        "requiresCompatibilities": ["FARGATE"],
+        "cpu": "512",
+        "memory": "1024",
+        "executionRoleArn": execution_role_arn,
+        "taskRoleArn": task_role_arn,
+        "containerDefinitions": [
             {
                 "name": CONTAINER_NAME,
-                "image": ecr_uri,
+                "image": _ecr_image_uri(account_id),
                 "essential": True,
                 "portMappings": [{"containerPort": CONTAINER_PORT, "protocol": "tcp"}],
                 "logConfiguration": {
@@ -396,7 +434,22 @@ def register_task_definition(account_id: str, execution_role_arn: str, task_role
                 },
             }
         ],
-    )
+    }
+    # 정의 내용 해시를 컨테이너 라벨로 저장 → 다음 실행 시 최신 리비전과 비교
+    desired_hash = hashlib.sha256(json.dumps(task_def, sort_keys=True).encode()).hexdigest()
+    task_def["containerDefinitions"][0]["dockerLabels"] = {TASK_DEF_HASH_LABEL: desired_hash}
+
+    try:
+        latest = ecs.describe_task_definition(taskDefinition=TASK_FAMILY)["taskDefinition"]
+        labels = latest["containerDefinitions"][0].get("dockerLabels", {})
+        if latest.get("status") == "ACTIVE" and labels.get(TASK_DEF_HASH_LABEL) == desired_hash:
+            task_def_arn = latest["taskDefinitionArn"]
+            print(f"  Task definition unchanged: {task_def_arn}")
+            return task_def_arn
+    except ecs.exceptions.ClientException:
+        pass  # 최초 등록
+
+    resp = ecs.register_task_definition(**task_def)
     task_def_arn = resp["taskDefinition"]["taskDefinitionArn"]
     print(f"  Registered task definition: {task_def_arn}")
     return task_def_arn
@@ -404,7 +457,7 @@ def register_task_definition(account_id: str, execution_role_arn: str, task_role
 
 def create_ecs_service(cluster_arn: str, task_def_arn: str, tg_arn: str, subnet_ids: list, task_sg_id: str):
     """ECS Fargate Service 생성"""
-    ecs = boto3.client("ecs", region_name=REGION)
+    ecs = _client("ecs")
 
     # 기존 서비스 확인
     try:
@@ -450,7 +503,19 @@ def create_ecs_service(cluster_arn: str, task_def_arn: str, tg_arn: str, subnet_
 
 def create_app_cloudfront(alb_dns: str):
     """앱용 CloudFront 배포 생성 (동적 콘텐츠, 캐싱 비활성화)"""
-    cf = boto3.client("cloudfront", region_name=REGION)
+    cf = _client("cloudfront")
+
+    # 저장된 배포 ID가 있으면 직접 조회 (전체 배포 목록 페이지네이션 생략)
+    saved_id = _CFG.get("app_cloudfront_distribution_id", "")
+    if saved_id:
+        try:
+            dist = cf.get_distribution(Id=saved_id)["Distribution"]
+            if dist["DistributionConfig"].get("Comment") == APP_CF_COMMENT:
+                domain = dist["DomainName"]
+                print(f"  App CF already exists: {domain}")
+                return domain, dist["Id"]
+        except cf.exceptions.NoSuchDistribution:
+            pass
 
     # 기존 배포 확인
     paginator = cf.get_paginator("list_distributions")
@@ -512,21 +577,15 @@ def create_app_cloudfront(alb_dns: str):
 
 def save_infra_config(app_cf_domain: str, app_cf_id: str, alb_dns: str):
     """인프라 정보를 admin_config.json에 저장"""
-    config_path = Path(__file__).resolve().parent.parent / "admin_config.json"
-    config = {}
-    if config_path.exists():
-        with open(config_path, "r", encoding="utf-8") as f:
-            config = json.load(f)
-
-    config["app_cloudfront_domain"] = f"https://{app_cf_domain}"
-    config["app_cloudfront_distribution_id"] = app_cf_id
-    config["alb_dns"] = alb_dns
-    config["ecs_cluster"] = CLUSTER_NAME
-    config["ecs_service"] = SERVICE_NAME
+    _CFG["app_cloudfront_domain"] = f"https://{app_cf_domain}"
+    _CFG["app_cloudfront_distribution_id"] = app_cf_id
+    _CFG["alb_dns"] = alb_dns
+    _CFG["ecs_cluster"] = CLUSTER_NAME
+    _CFG["ecs_service"] = SERVICE_NAME
 
-    with open(config_path, "w", encoding="utf-8") as f:
-        json.dump(config, f, indent=2, ensure_ascii=False)
-    print(f"  Saved infra config to {config_path}")
+    with open(CONFIG_PATH, "w", encoding="utf-8") as f:
+        json.dump(_CFG, f, indent=2, ensure_ascii=False)
+    print(f"  Saved infra config to {CONFIG_PATH}")
 
 
 def main():
@@ -535,34 +594,36 @@ def main():
     print(f"Region: {REGION}")
     print()
 
-    # 1. VPC + Subnets
-    print("[1/8] Getting VPC and subnets...")
-    vpc_id, subnet_ids = get_default_vpc_and_subnets()
-
-    # 2. Security Groups
-    print("\n[2/8] Creating security groups...")
-    alb_sg_id, task_sg_id = create_security_groups(vpc_id)
-
-    # 3. IAM Roles
-    print("\n[3/8] Creating IAM roles...")
-    execution_role_arn, task_role_arn = create_iam_roles(account_id)
-
-    # 4. CloudWatch Logs
-    print("\n[4/8] Creating log group...")
-    log_group = create_log_group()
-
-    # 5. ALB + Target Group
-    print("\n[5/8] Creating ALB and Target Group...")
-    alb_arn, alb_dns, tg_arn = create_alb(subnet_ids, alb_sg_id, vpc_id)
-
-    # 6. ECS Cluster
-    print("\n[6/8] Creating ECS cluster...")
-    cluster_arn = create_ecs_cluster()
-
-    # 7. Task Definition + Service
-    print("\n[7/8] Registering task definition and creating service...")
-    task_def_arn = register_task_definition(account_id, execution_role_arn, task_role_arn, log_group)
-    create_ecs_service(cluster_arn, task_def_arn, tg_arn, subnet_ids, task_sg_id)
+    with ThreadPoolExecutor(max_workers=6) as executor:
+        # 1~3. VPC + Subnets / IAM Roles / CloudWatch Logs — 상호 의존성 없음, 동시 실행
+        print("[1-3/8] Getting VPC and subnets, creating IAM roles and log group...")
+        f_vpc = executor.submit(get_default_vpc_and_subnets)
+        f_iam = executor.submit(create_iam_roles, account_id)
+        f_logs = executor.submit(create_log_group)
+
+        # 4. Security Groups (VPC 필요)
+        vpc_id, subnet_ids = f_vpc.result()
+        print("\n[4/8] Creating security groups...")
+        alb_sg_id, task_sg_id = create_security_groups(vpc_id)
+
+        # 5~6. ALB + Target Group / ECS Cluster — 동시 실행
+        print("\n[5-6/8] Creating ALB, Target Group and ECS cluster...")
+        f_alb = executor.submit(create_alb, subnet_ids, alb_sg_id, vpc_id)
+        f_cluster = executor.submit(create_ecs_cluster)
+
+        # ALB active 대기는 백그라운드로 — 태스크 정의 등록과 겹쳐서 진행
+        alb_arn, alb_dns, tg_arn = f_alb.result()
+        f_alb_ready = executor.submit(_wait_alb, alb_arn, tg_arn)
+
+        execution_role_arn, task_role_arn = f_iam.result()
+        log_group = f_logs.result()
+        cluster_arn = f_cluster.result()
+
+        # 7. Task Definition + Service
+        print("\n[7/8] Registering task definition and creating service...")
+        task_def_arn = register_task_definition(account_id, execution_role_arn, task_role_arn, log_group)
+        f_alb_ready.result()
+        create_ecs_service(cluster_arn, task_def_arn, tg_arn, subnet_ids, task_sg_id)
 
     # 8. App CloudFront
     print("\n[8/8] Creating app CloudFront distribution...")
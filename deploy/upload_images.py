@@ -4,85 +4,276 @@
 """
 
 import boto3
-import mimetypes
+import hashlib
+import io
+import json
+import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
+from boto3.s3.transfer import S3Transfer, TransferConfig
+from botocore.config import Config
+from botocore.exceptions import ClientError
 
 REGION = "us-east-1"
 S3_PREFIX = "emotion-images"
 
+# 대용량 이미지는 8MB 단위 멀티파트로 분할해 병렬 업로드
+MB = 1024 * 1024
+TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=8 * MB,
+    multipart_chunksize=8 * MB,
+    max_concurrency=16,
+    use_threads=True,
+)
+
+CONFIG_PATH = Path(__file__).resolve().parent.parent / "admin_config.json"
+# 챗봇 컨테이너에 포함되는 설정 (admin_config.json은 이미지에 포함되지 않음)
+CHATBOT_CONFIG_PATH = Path(__file__).resolve().parent.parent / "chatbot_config.json"
+WEBP_QUALITY = 85
+
+# admin_config.json은 프로세스당 1회만 읽어 공유
+try:
+    _CFG = json.loads(CONFIG_PATH.read_text(encoding="utf-8")) if CONFIG_PATH.exists() else {}
+except json.JSONDecodeError as e:
+    # 이 스크립트는 admin_config.json을 다시 쓰지 않으므로 경고 후 무시 (S3_BUCKET_NAME 환경변수로 진행 가능)
+    print(f"Warning: {CONFIG_PATH} is not valid JSON ({e}); ignoring it")
+    _CFG = {}
+
+
 # Config에서 버킷명 로드
 def _get_bucket_name():
-    import os
-    env_val = os.environ.get("S3_BUCKET_NAME", "")
-    if env_val:
-        return env_val
-    try:
-        import json
-        with open(Path(__file__).resolve().parent.parent / "admin_config.json", "r") as f:
-            return json.load(f).get("bucket_name", "")
-    except (FileNotFoundError, json.JSONDecodeError):
-        return ""
+    return os.environ.get("S3_BUCKET_NAME", "") or _CFG.get("bucket_name", "")
 
 BUCKET_NAME = _get_bucket_name()
 IMAGE_EXTENSIONS = {".jpg", ".jpeg", ".png", ".webp"}
+MAX_WORKERS = 32
+# 동시 업로드 시 스로틀링 재시도 / 커넥션 풀 부족 방지
+CLIENT_CONFIG = Config(
+    retries={"mode": "adaptive", "max_attempts": 10},
+    max_pool_connections=64,
+    tcp_keepalive=True,
+)
+_CT = {".jpg": "image/jpeg", ".jpeg": "image/jpeg", ".png": "image/png", ".webp": "image/webp"}
+
+
+def _list_existing(s3, bucket: str, prefix: str) -> dict:
+    """프리픽스 아래 기존 객체를 {key: (size, etag)}로 조회"""
+    existing = {}
+    paginator = s3.get_paginator("list_objects_v2")
+    for page in paginator.paginate(Bucket=bucket, Prefix=prefix):
+        for obj in page.get("Contents", []):
+            existing[obj["Key"]] = (obj["Size"], obj["ETag"].strip('"'))
+    return existing
+
+
+def _head_existing(s3, bucket: str, keys: list) -> dict:
+    """후보 키별 HEAD 요청을 동시에 보내 존재하는 객체만 {key: (size, etag)}로 반환
+
+    프리픽스에 객체가 많아 LIST 전체 전송이 부담될 때 사용 (--head-check)
+    """
+    def _exists(key):
+        try:
+            return s3.head_object(Bucket=bucket, Key=key)
+        except ClientError as e:
+            if e.response["Error"]["Code"] in ("404", "NoSuchKey"):
+                return None
+            raise
+
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        results = executor.map(_exists, keys)
+        return {
+            key: (head["ContentLength"], head["ETag"].strip('"'))
+            for key, head in zip(keys, results)
+            if head is not None
+        }
+
+
+def _to_webp(img_file: Path) -> bytes:
+    """PNG → WebP 변환 (Pillow 필요: pip install Pillow)"""
+    from PIL import Image
+
+    buf = io.BytesIO()
+    with Image.open(img_file) as im:
+        im.save(buf, "WEBP", quality=WEBP_QUALITY, method=6)
+    return buf.getvalue()
+
+
+def _save_webp_map(webp_map: dict):
+    """원본 → WebP 파일명 매핑을 chatbot_config.json에 저장 (챗봇이 CDN URL 생성 시 사용)"""
+    config = {}
+    if CHATBOT_CONFIG_PATH.exists():
+        with open(CHATBOT_CONFIG_PATH, "r", encoding="utf-8") as f:
+            config = json.load(f)
+
+    config["emotion_image_webp"] = webp_map
+
+    with open(CHATBOT_CONFIG_PATH, "w", encoding="utf-8") as f:
+        json.dump(config, f, indent=2, ensure_ascii=False)
+    print(f"  Saved WebP mapping ({len(webp_map)} files) to {CHATBOT_CONFIG_PATH}")
 
 
-def upload_images(image_dir: Path, bucket: str = BUCKET_NAME, prefix: str = S3_PREFIX, dry_run: bool = False):
-    s3 = boto3.client("s3", region_name=REGION)
+def _is_unchanged(img_file: Path, local_size: int, remote, data: bytes = None) -> bool:
+    """로컬 파일(또는 변환된 data)이 S3 객체와 동일한지 (크기 → MD5/ETag 순으로 비교)"""
+    if remote is None:
+        return False
+    size, etag = remote
+    if local_size != size:
+        return False
+    # 멀티파트 업로드 객체의 ETag는 MD5가 아니므로 비교 불가 → 재업로드
+    if "-" in etag:
+        return False
+    if data is None:
+        data = img_file.read_bytes()
+    return hashlib.md5(data).hexdigest() == etag
+
+
+def _target_name(filename: str, webp: bool) -> str:
+    """업로드될 파일명 (webp 모드에서는 .png → .webp)"""
+    stem, ext = os.path.splitext(filename)
+    return f"{stem}.webp" if webp and ext.lower() == ".png" else filename
+
+
+def _upload_one(s3, transfer, bucket: str, item: tuple) -> str:
+    """계획 항목 1건 처리 (워커 스레드): WebP 변환 → 변경 여부 비교 → 업로드
+
+    반환: "uploaded" | "unchanged" | "failed"
+    """
+    img_file, s3_key, content_type, size, remote, convert = item
+    try:
+        data = None
+        if convert:
+            data = _to_webp(img_file)
+            size = len(data)
+        if _is_unchanged(img_file, size, remote, data):
+            print(f"  Unchanged: s3://{bucket}/{s3_key}")
+            return "unchanged"
+
+        if data is not None:
+            s3.put_object(Bucket=bucket, Key=s3_key, Body=data, ContentType=content_type)
+        elif size < TRANSFER_CONFIG.multipart_threshold:
+            # 작은 감정 스프라이트는 단일 PUT으로 파일 핸들을 그대로 스트리밍
+            with open(img_file, "rb") as body:
+                s3.put_object(
+                    Bucket=bucket,
+                    Key=s3_key,
+                    Body=body,
+                    ContentLength=size,
+                    ContentType=content_type,
+                )
+        else:
+            transfer.upload_file(
+                str(img_file),
+                bucket,
+                s3_key,
+                extra_args={"ContentType": content_type},
+            )
+        print(f"  Uploaded: s3://{bucket}/{s3_key}")
+        return "uploaded"
+    except Exception as e:
+        print(f"  FAILED: {s3_key} — {e}")
+        return "failed"
+
+
+def _scan_images(image_dir: Path) -> list:
+    """image/ 트리를 1회 순회해 (캐릭터 폴더명, DirEntry) 목록 반환 (이름순)
+
+    DirEntry는 is_dir()/is_file()/stat() 결과를 캐시 → 항목당 추가 stat 없음
+    """
+    found = []
+    with os.scandir(image_dir) as it:
+        char_entries = sorted((e for e in it if e.is_dir()), key=lambda e: e.name)
+    for char_entry in char_entries:
+        with os.scandir(char_entry.path) as it:
+            img_entries = sorted(
+                (e for e in it if e.is_file() and os.path.splitext(e.name)[1].lower() in IMAGE_EXTENSIONS),
+                key=lambda e: e.name,
+            )
+        found.extend((char_entry.name, e) for e in img_entries)
+    return found
+
+
+def upload_images(image_dir: Path, bucket: str = BUCKET_NAME, prefix: str = S3_PREFIX, dry_run: bool = False,
+                  head_check: bool = False, webp: bool = False):
+    s3 = boto3.client("s3", region_name=REGION, config=CLIENT_CONFIG)
+    transfer = S3Transfer(s3, TRANSFER_CONFIG)
 
     if not image_dir.is_dir():
         print(f"Error: {image_dir} is not a directory")
         sys.exit(1)
 
+    images = _scan_images(image_dir)
+    targets = [
+        (folder_name, img_entry, f"{prefix}/{folder_name}/{_target_name(img_entry.name, webp)}")
+        for folder_name, img_entry in images
+    ]
+
+    # 기존 객체 조회: 캐릭터 폴더별 LIST 1회, 또는 후보 키 전체 HEAD 동시 요청
+    existing = {}
+    if dry_run:
+        pass
+    elif head_check:
+        existing = _head_existing(s3, bucket, [s3_key for _, _, s3_key in targets])
+    else:
+        for folder_name in sorted({folder_name for folder_name, _ in images}):
+            existing.update(_list_existing(s3, bucket, f"{prefix}/{folder_name}/"))
+
     uploaded = 0
-    skipped = 0
+    webp_map = {}
+    plan = []  # [(path, key, content_type, size, remote, convert)]
+
+    for folder_name, img_entry, s3_key in targets:
+        img_file = Path(img_entry.path)
+        target_name = s3_key.rsplit("/", 1)[-1]
+        content_type = _CT.get(Path(target_name).suffix.lower(), "application/octet-stream")
+        if target_name != img_file.name:
+            webp_map[f"{folder_name}/{img_file.name}"] = target_name
 
-    for char_folder in sorted(image_dir.iterdir()):
-        if not char_folder.is_dir():
+        if dry_run:
+            print(f"  [DRY-RUN] {img_file} -> s3://{bucket}/{s3_key}  ({content_type})")
+            uploaded += 1
             continue
 
-        folder_name = char_folder.name  # e.g. rumi, mira, zoey
-        for img_file in sorted(char_folder.iterdir()):
-            if not img_file.is_file() or img_file.suffix.lower() not in IMAGE_EXTENSIONS:
-                continue
-
-            s3_key = f"{prefix}/{folder_name}/{img_file.name}"
-            content_type = mimetypes.guess_type(str(img_file))[0] or "application/octet-stream"
-
-            if dry_run:
-                print(f"  [DRY-RUN] {img_file} -> s3://{bucket}/{s3_key}  ({content_type})")
-                uploaded += 1
-                continue
-
-            try:
-                s3.upload_file(
-                    str(img_file),
-                    bucket,
-                    s3_key,
-                    ExtraArgs={"ContentType": content_type},
-                )
-                print(f"  Uploaded: s3://{bucket}/{s3_key}")
-                uploaded += 1
-            except Exception as e:
-                print(f"  FAILED: {s3_key} — {e}")
-                skipped += 1
+        # WebP 변환·MD5 비교는 워커에서 수행 (메인 스레드는 계획만 구성)
+        convert = target_name != img_file.name
+        plan.append((img_file, s3_key, content_type, img_entry.stat().st_size, existing.get(s3_key), convert))
+
+    # 전체 계획을 한 번에 풀에 투입 → 특정 폴더에 파일이 몰려도 워커가 고르게 분배됨
+    if plan:
+        print(f"  Processing {len(plan)} file(s) with {MAX_WORKERS} workers...")
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        results = list(executor.map(partial(_upload_one, s3, transfer, bucket), plan))
+    uploaded += results.count("uploaded")
+    skipped_existing = results.count("unchanged")
+    failed = results.count("failed")
+
+    # 일부 업로드가 실패하면 존재하지 않는 .webp 키를 가리키게 되므로 매핑 저장 생략
+    if webp and not dry_run:
+        if failed:
+            print(f"  Skipped saving WebP mapping: {failed} upload(s) failed")
+        else:
+            _save_webp_map(webp_map)
 
-    print(f"\nDone. Uploaded: {uploaded}, Skipped/Failed: {skipped}")
+    print(f"\nDone. Uploaded: {uploaded}, Unchanged: {skipped_existing}, Failed: {failed}")
     return uploaded
 
 
-def verify_upload(bucket: str = BUCKET_NAME, prefix: str = S3_PREFIX):
-    s3 = boto3.client("s3", region_name=REGION)
+def verify_upload(bucket: str = BUCKET_NAME, prefix: str = S3_PREFIX, verbose: bool = False):
+    s3 = boto3.client("s3", region_name=REGION, config=CLIENT_CONFIG)
+    s3.head_bucket(Bucket=bucket)
     paginator = s3.get_paginator("list_objects_v2")
 
     print(f"\nVerifying s3://{bucket}/{prefix}/")
     count = 0
+    total_bytes = 0
     for page in paginator.paginate(Bucket=bucket, Prefix=f"{prefix}/"):
         for obj in page.get("Contents", []):
-            print(f"  {obj['Key']}  ({obj['Size']} bytes)")
+            if verbose:
+                print(f"  {obj['Key']}  ({obj['Size']} bytes)")
             count += 1
-    print(f"Total objects: {count}")
+            total_bytes += obj["Size"]
+    print(f"Total objects: {count} ({total_bytes / 1e6:.1f} MB)")
 
 
 if __name__ == "__main__":
@@ -90,6 +281,9 @@ if __name__ == "__main__":
     image_dir = project_root / "image"
 
     dry_run = "--dry-run" in sys.argv
+    head_check = "--head-check" in sys.argv
+    webp = "--webp" in sys.argv
+    verbose = "--verbose" in sys.argv
 
     if dry_run:
         print("=== DRY RUN MODE ===\n")
@@ -97,7 +291,7 @@ if __name__ == "__main__":
     print(f"Source: {image_dir}")
     print(f"Target: s3://{BUCKET_NAME}/{S3_PREFIX}/\n")
 
-    upload_images(image_dir, dry_run=dry_run)
+    upload_images(image_dir, dry_run=dry_run, head_check=head_check, webp=webp)
 
     if not dry_run:
-        verify_upload()
+        verify_upload(verbose=verbose)
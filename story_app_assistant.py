@@ -4,14 +4,20 @@
 StoryAssistantManager: 스토리 가이드 + 초안 생성
 """
 
-import boto3
-import json
+import html
 import logging
-from typing import Dict, Any, List
-
+import os
+import threading
+from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from functools import lru_cache
+from typing import Dict, Any, List, Callable, Optional
+
+import orjson
 import streamlit as st
 
 from admin_app_analytics import CustomerAnalyticsManager
+from story_app_common import cached_characters, cached_contents, cached_relationships
 
 logger = logging.getLogger("story_app.assistant")
 
@@ -26,6 +32,18 @@ MODEL_DISPLAY_NAMES = {
 }
 
 
+# Hedged 요청: primary가 HEDGE_DELAY_SEC 안에 응답하지 않으면 fallback 동시 호출 (비용 증가 → 기본 비활성)
+HEDGE_ENABLED = os.environ.get("STORY_LLM_HEDGE", "").lower() in ("1", "true")
+HEDGE_DELAY_SEC = 3.0
+
+# 스트리밍 시 UI 갱신 주기 (텍스트 델타 N개마다 1회)
+STREAM_RENDER_EVERY = 20
+
+# 고객 데이터 수집 시 사용자별 조회 동시 실행 수
+AUDIENCE_FETCH_WORKERS = 16
+
+
+@lru_cache(maxsize=32)
 def _model_display_name(model_id: str) -> str:
     if model_id in MODEL_DISPLAY_NAMES:
         return MODEL_DISPLAY_NAMES[model_id]
@@ -35,12 +53,13 @@ def _model_display_name(model_id: str) -> str:
 
 # ─── 프롬프트 ───────────────────────────────────────────────
 
-STORY_GUIDE_PROMPT = """당신은 전문 스토리 컨설턴트입니다. 아래 스토리 컨텍스트와 고객 반응 데이터를 분석하여, 스토리 작가에게 유용한 방향 가이드를 JSON으로 반환해주세요.
-반드시 유효한 JSON만 출력하세요. 다른 텍스트는 포함하지 마세요.
-
-=== 스토리 컨텍스트 ===
+# 스토리 컨텍스트를 두 프롬프트 공통 prefix로 두어 Bedrock 프롬프트 캐시를 가이드 → 초안 호출 간 공유
+STORY_GUIDE_PROMPT = """=== 스토리 컨텍스트 ===
 {story_context}
 
+당신은 전문 스토리 컨설턴트입니다. 위 스토리 컨텍스트와 아래 고객 반응 데이터를 분석하여, 스토리 작가에게 유용한 방향 가이드를 JSON으로 반환해주세요.
+반드시 유효한 JSON만 출력하세요. 다른 텍스트는 포함하지 마세요.
+
 === 고객 반응 데이터 ===
 {audience_data}
 
@@ -55,12 +74,12 @@ STORY_GUIDE_PROMPT = """당신은 전문 스토리 컨설턴트입니다. 아래
 
 JSON 출력:"""
 
-STORY_DRAFT_PROMPT = """당신은 전문 스토리 작가입니다. 아래 스토리 컨텍스트와 선택한 가이드를 바탕으로 에피소드 초안을 작성해주세요.
-반드시 유효한 JSON만 출력하세요. 다른 텍스트는 포함하지 마세요.
-
-=== 스토리 컨텍스트 ===
+STORY_DRAFT_PROMPT = """=== 스토리 컨텍스트 ===
 {story_context}
 
+당신은 전문 스토리 작가입니다. 위 스토리 컨텍스트와 아래 선택한 가이드를 바탕으로 에피소드 초안을 작성해주세요.
+반드시 유효한 JSON만 출력하세요. 다른 텍스트는 포함하지 마세요.
+
 === 선택한 가이드 ===
 {guide_selection}
 
@@ -77,58 +96,197 @@ STORY_DRAFT_PROMPT = """당신은 전문 스토리 작가입니다. 아래 스
 JSON 출력:"""
 
 
+def _split_prompt(template: str, *placeholders: str) -> tuple:
+    """프롬프트 템플릿을 placeholder 위치에서 분할 (import 시 1회)"""
+    parts = []
+    rest = template
+    for name in placeholders:
+        head, rest = rest.split("{" + name + "}", 1)
+        parts.append(head)
+    parts.append(rest)
+    return tuple(parts)
+
+
+_G0, _G1, _G2 = _split_prompt(STORY_GUIDE_PROMPT, "story_context", "audience_data")
+_D0, _D1, _D2 = _split_prompt(STORY_DRAFT_PROMPT, "story_context", "guide_selection")
+
+
+def _cached_block(text: str) -> Dict[str, Any]:
+    """프롬프트 캐시 대상 블록 (cache_control: ephemeral, 5분 유지)"""
+    return {"type": "text", "text": text, "cache_control": {"type": "ephemeral"}}
+
+
+def _guide_content(story_context: str, audience_data: str) -> List[Dict[str, Any]]:
+    return [
+        _cached_block(f"{_G0}{story_context}"),
+        {"type": "text", "text": f"{_G1}{audience_data}{_G2}"},
+    ]
+
+
+def _draft_content(story_context: str, guide_selection: str) -> List[Dict[str, Any]]:
+    return [
+        _cached_block(f"{_D0}{story_context}"),
+        {"type": "text", "text": f"{_D1}{guide_selection}{_D2}"},
+    ]
+
+
 class StoryAssistantManager:
     """AI 스토리 가이드 + 초안 생성"""
 
     def __init__(self, region: str = "us-east-1"):
-        self.bedrock = boto3.client("bedrock-runtime", region_name=region)
+        self.region = region
+        self._bedrock = None
+        self._bedrock_lock = threading.Lock()
+
+    @property
+    def bedrock(self):
+        """첫 LLM 호출 시점에 boto3 import + 클라이언트 생성 (다른 페이지 cold start 비용 제거)"""
+        if self._bedrock is None:
+            with self._bedrock_lock:
+                if self._bedrock is None:
+                    import boto3
+                    from botocore.config import Config
+                    # 계정 RPM 한도에 걸려도 클라이언트 측 토큰 버킷 + 지터 백오프로 재시도
+                    cfg = Config(
+                        retries={"max_attempts": 6, "mode": "adaptive"},
+                        max_pool_connections=32,
+                        read_timeout=120,
+                        connect_timeout=10,
+                    )
+                    self._bedrock = boto3.client("bedrock-runtime", region_name=self.region, config=cfg)
+        return self._bedrock
+
+    def generate_story_guide(self, story_context: str, audience_data: str,
+                             on_delta: Optional[Callable[[str], None]] = None) -> Dict[str, Any]:
+        """스토리 방향 가이드 생성 (on_delta 지정 시 스트리밍, hedged 모드에서는 일괄 응답)"""
+        content = _guide_content(story_context, audience_data)
+        if on_delta and not HEDGE_ENABLED:
+            return self._invoke_llm_stream(content, on_delta=on_delta)
+        return self._invoke_llm(content)
+
+    def generate_draft(self, story_context: str, guide_selection: str,
+                       on_delta: Optional[Callable[[str], None]] = None) -> Dict[str, Any]:
+        """스토리 초안 생성 (on_delta 지정 시 스트리밍, hedged 모드에서는 일괄 응답)"""
+        content = _draft_content(story_context, guide_selection)
+        if on_delta and not HEDGE_ENABLED:
+            return self._invoke_llm_stream(content, max_tokens=8192, on_delta=on_delta)
+        return self._invoke_llm(content, max_tokens=8192)
+
+    @staticmethod
+    def _request_body(content: List[Dict[str, Any]], max_tokens: int) -> bytes:
+        return orjson.dumps({
+            "anthropic_version": "bedrock-2023-05-31",
+            "max_tokens": max_tokens,
+            "messages": [{"role": "user", "content": content}],
+            "temperature": 0.7,
+        })
+
+    @staticmethod
+    def _parse_llm_text(text: str, model_id: str) -> Dict[str, Any]:
+        """LLM 응답 텍스트 → dict (최외곽 {...} 구간만 1회 파싱, 실패 시 raw text 반환)"""
+        # 코드블록 래핑/앞뒤 설명문을 strip·split 복사 없이 슬라이스 한 번으로 제거
+        start = text.find("{")
+        end = text.rfind("}")
+        parsed = None
+        if start != -1 and end > start:
+            try:
+                parsed = orjson.loads(text[start:end + 1])
+            except orjson.JSONDecodeError:
+                parsed = None
+        if not isinstance(parsed, dict):
+            logger.warning("LLM JSON 파싱 실패 (%s), raw text 반환", model_id)
+            return {"raw_response": text.strip(), "_model": _model_display_name(model_id)}
+        parsed["_model"] = _model_display_name(model_id)
+        return parsed
+
+    def _call_model(self, model_id: str, content: List[Dict[str, Any]], max_tokens: int) -> str:
+        """단일 모델 호출 → 응답 텍스트 (실패 시 예외)"""
+        body = self._request_body(content, max_tokens)
+        response = self.bedrock.invoke_model(modelId=model_id, body=body)
+        result = orjson.loads(response["body"].read())
+        return result["content"][0]["text"]
+
+    @staticmethod
+    def _log_llm_failure(model_id: str, e: Exception):
+        from botocore.exceptions import ClientError
+        if isinstance(e, ClientError) and e.response["Error"]["Code"] == "ThrottlingException":
+            logger.warning("LLM 호출 스로틀링 (%s)", model_id)
+        else:
+            logger.warning("LLM 호출 실패 (%s): %s", model_id, e)
 
-    def generate_story_guide(self, story_context: str, audience_data: str) -> Dict[str, Any]:
-        """스토리 방향 가이드 생성"""
-        prompt = STORY_GUIDE_PROMPT.format(
-            story_context=story_context,
-            audience_data=audience_data,
-        )
-        return self._invoke_llm(prompt)
+    def _invoke_llm(self, content: List[Dict[str, Any]], max_tokens: int = 4096) -> Dict[str, Any]:
+        """Bedrock Claude 호출 (primary → fallback, HEDGE_ENABLED면 hedged 호출)"""
+        if HEDGE_ENABLED:
+            return self._invoke_llm_hedged(content, max_tokens)
 
-    def generate_draft(self, story_context: str, guide_selection: str) -> Dict[str, Any]:
-        """스토리 초안 생성"""
-        prompt = STORY_DRAFT_PROMPT.format(
-            story_context=story_context,
-            guide_selection=guide_selection,
-        )
-        return self._invoke_llm(prompt, max_tokens=8192)
+        for model_id in [MODEL_PRIMARY, MODEL_FALLBACK]:
+            try:
+                text = self._call_model(model_id, content, max_tokens)
+            except Exception as e:
+                self._log_llm_failure(model_id, e)
+                continue
+            return self._parse_llm_text(text, model_id)
+
+        return {"error": "모든 모델 호출 실패"}
 
-    def _invoke_llm(self, prompt: str, max_tokens: int = 4096) -> Dict[str, Any]:
-        """Bedrock Claude 호출 (primary → fallback)"""
+    def _invoke_llm_hedged(self, content: List[Dict[str, Any]], max_tokens: int) -> Dict[str, Any]:
+        """Hedged 호출: primary 먼저, HEDGE_DELAY_SEC 내 응답 없거나 실패하면 fallback도 호출
+
+        먼저 성공한 응답을 사용 (늦은 쪽은 백그라운드에서 끝까지 실행되므로 비용은 최대 2배)
+        """
+        executor = ThreadPoolExecutor(max_workers=2)
+        futures = {executor.submit(self._call_model, MODEL_PRIMARY, content, max_tokens): MODEL_PRIMARY}
+        try:
+            done, _ = wait(futures, timeout=HEDGE_DELAY_SEC)
+            primary = next(iter(futures))
+            if not done or primary.exception() is not None:
+                futures[executor.submit(self._call_model, MODEL_FALLBACK, content, max_tokens)] = MODEL_FALLBACK
+
+            pending = set(futures)
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    model_id = futures[future]
+                    if future.exception() is not None:
+                        self._log_llm_failure(model_id, future.exception())
+                        continue
+                    for other in pending:
+                        other.cancel()
+                    return self._parse_llm_text(future.result(), model_id)
+        finally:
+            executor.shutdown(wait=False)
+
+        return {"error": "모든 모델 호출 실패"}
+
+    def _invoke_llm_stream(self, content: List[Dict[str, Any]], max_tokens: int = 4096,
+                           on_delta: Optional[Callable[[str], None]] = None) -> Dict[str, Any]:
+        """Bedrock Claude 스트리밍 호출 (primary → fallback)
+
+        텍스트 델타를 누적하며 STREAM_RENDER_EVERY개마다 on_delta(누적 텍스트)를 호출하고,
+        스트림 종료 후 한 번에 JSON 파싱
+        """
         for model_id in [MODEL_PRIMARY, MODEL_FALLBACK]:
             try:
-                body = json.dumps({
-                    "anthropic_version": "bedrock-2023-05-31",
-                    "max_tokens": max_tokens,
-                    "messages": [{"role": "user", "content": [{"type": "text", "text": prompt}]}],
-                    "temperature": 0.7,
-                })
-                response = self.bedrock.invoke_model(modelId=model_id, body=body)
-                result = json.loads(response["body"].read())
-                text = result["content"][0]["text"].strip()
-
-                # JSON 파싱 (코드블록 래핑 제거)
-                if text.startswith("```"):
-                    text = text.split("\n", 1)[1]
-                    if text.endswith("```"):
-                        text = text[:-3]
-                    text = text.strip()
-
-                parsed = json.loads(text)
-                parsed["_model"] = _model_display_name(model_id)
-                return parsed
-            except json.JSONDecodeError:
-                logger.warning("LLM JSON 파싱 실패 (%s), raw text 반환", model_id)
-                return {"raw_response": text, "_model": _model_display_name(model_id)}
+                body = self._request_body(content, max_tokens)
+                response = self.bedrock.invoke_model_with_response_stream(modelId=model_id, body=body)
+                parts = []
+                for event in response["body"]:
+                    chunk = event.get("chunk")
+                    if not chunk:
+                        continue
+                    data = orjson.loads(chunk["bytes"])
+                    if data.get("type") != "content_block_delta":
+                        continue
+                    parts.append(data.get("delta", {}).get("text", ""))
+                    if on_delta and len(parts) % STREAM_RENDER_EVERY == 0:
+                        on_delta("".join(parts))
+                text = "".join(parts)
             except Exception as e:
-                logger.warning("LLM 호출 실패 (%s): %s — fallback 시도", model_id, e)
+                self._log_llm_failure(model_id, e)
                 continue
+            if on_delta:
+                on_delta(text)
+            return self._parse_llm_text(text, model_id)
 
         return {"error": "모든 모델 호출 실패"}
 
@@ -137,6 +295,12 @@ class StoryAssistantManager:
 # Streamlit UI
 # ═══════════════════════════════════════════════════════════════
 
+@st.cache_resource(show_spinner=False)
+def _get_assistant() -> StoryAssistantManager:
+    """모든 세션이 공유하는 StoryAssistantManager"""
+    return StoryAssistantManager()
+
+
 def render_story_assistant(analytics_mgr: CustomerAnalyticsManager, data_mgr):
     """AI 스토리 어시스턴트 페이지"""
 
@@ -147,33 +311,28 @@ def render_story_assistant(analytics_mgr: CustomerAnalyticsManager, data_mgr):
     </div>
     """, unsafe_allow_html=True)
 
-    # 매니저 초기화
-    if "story_assistant_mgr" not in st.session_state:
-        st.session_state.story_assistant_mgr = StoryAssistantManager()
-    assistant = st.session_state.story_assistant_mgr
+    assistant = _get_assistant()
 
     # ── 1. 스토리 컨텍스트 입력 ──
     st.subheader("스토리 컨텍스트")
 
     # 콘텐츠 선택
-    if "assistant_contents" not in st.session_state:
-        with st.spinner("콘텐츠 목록 로딩 중..."):
-            st.session_state.assistant_contents = data_mgr.list_contents()
-
-    contents = st.session_state.assistant_contents
+    with st.spinner("콘텐츠 목록 로딩 중..."):
+        contents = cached_contents(data_mgr)
     if not contents:
         st.warning("등록된 콘텐츠가 없습니다.")
         return
 
+    content_by_id = {c["content_id"]: c for c in contents}
     content_options = {
-        f"{c.get('title', '')} ({c.get('title_en', '')})": c["content_id"]
-        for c in contents
+        f"{c.get('title', '')} ({c.get('title_en', '')})": cid
+        for cid, c in content_by_id.items()
     }
     selected_label = st.selectbox(
         "콘텐츠 선택", list(content_options.keys()), key="assistant_content_select"
     )
     content_id = content_options[selected_label]
-    content = next((c for c in contents if c["content_id"] == content_id), {})
+    content = content_by_id.get(content_id, {})
 
     col1, col2 = st.columns([3, 1])
     with col2:
@@ -195,50 +354,7 @@ def render_story_assistant(analytics_mgr: CustomerAnalyticsManager, data_mgr):
 
     if st.button("고객 데이터 수집", key="assistant_collect_audience"):
         with st.spinner("전체 사용자 데이터 집계 중..."):
-            users = analytics_mgr.list_users()
-            audience_summary_parts = []
-
-            total_conversations = 0
-            char_counts = {}
-            sentiment_total = {"positive": 0, "neutral": 0, "negative": 0}
-            all_keywords = []
-
-            for user in users:
-                user_data = analytics_mgr.get_user_full_data(user["user_id"])
-                total_conversations += user_data.get("conversation_count", 0)
-
-                for char, cnt in user_data.get("character_chat_counts", {}).items():
-                    char_counts[char] = char_counts.get(char, 0) + cnt
-
-                for sentiment, cnt in user_data.get("sentiment_distribution", {}).items():
-                    sentiment_total[sentiment] = sentiment_total.get(sentiment, 0) + cnt
-
-                all_keywords.extend(user_data.get("top_keywords", []))
-
-            # 요약 텍스트 생성
-            audience_summary_parts.append(f"총 사용자 수: {len(users)}")
-            audience_summary_parts.append(f"총 대화 수: {total_conversations}")
-
-            if char_counts:
-                sorted_chars = sorted(char_counts.items(), key=lambda x: -x[1])
-                audience_summary_parts.append(
-                    "캐릭터별 대화 수: " + ", ".join(f"{c}({n}회)" for c, n in sorted_chars)
-                )
-
-            total_sentiments = sum(sentiment_total.values())
-            if total_sentiments > 0:
-                audience_summary_parts.append(
-                    "감정 분포: " + ", ".join(
-                        f"{k}={round(v/total_sentiments*100)}%" for k, v in sentiment_total.items()
-                    )
-                )
-
-            if all_keywords:
-                from collections import Counter
-                top_kw = [kw for kw, _ in Counter(all_keywords).most_common(15)]
-                audience_summary_parts.append(f"주요 키워드: {', '.join(top_kw)}")
-
-            st.session_state.assistant_audience_data = "\n".join(audience_summary_parts)
+            st.session_state.assistant_audience_data = _collect_audience_summary(analytics_mgr)
 
     audience_data = st.session_state.get("assistant_audience_data", "")
     if audience_data:
@@ -257,9 +373,19 @@ def render_story_assistant(analytics_mgr: CustomerAnalyticsManager, data_mgr):
         if not audience_data:
             st.warning("먼저 '고객 데이터 수집'을 실행해주세요.")
         else:
-            with st.spinner(f"{_model_display_name(MODEL_PRIMARY)}(이)가 스토리 가이드를 생성 중입니다..."):
-                result = assistant.generate_story_guide(story_context, audience_data)
-                st.session_state.assistant_guide_result = result
+            placeholder = st.empty()
+            placeholder.caption(f"{_model_display_name(MODEL_PRIMARY)}(이)가 스토리 가이드를 생성 중입니다...")
+            result = assistant.generate_story_guide(
+                story_context, audience_data,
+                on_delta=lambda text: placeholder.code(text, language="json"),
+            )
+            placeholder.empty()
+            st.session_state.assistant_guide_result = result
+            # 초안 프롬프트용 직렬화는 생성 직후 1회 (내부 메타 키 `_model` 등 제외)
+            st.session_state.assistant_guide_text = orjson.dumps(
+                {k: v for k, v in result.items() if not k.startswith("_")},
+                option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+            ).decode()
 
     guide_result = st.session_state.get("assistant_guide_result")
     if guide_result:
@@ -271,10 +397,15 @@ def render_story_assistant(analytics_mgr: CustomerAnalyticsManager, data_mgr):
 
     if guide_result and "error" not in guide_result and "raw_response" not in guide_result:
         if st.button("초안 작성", key="assistant_generate_draft", type="primary"):
-            guide_text = json.dumps(guide_result, ensure_ascii=False, indent=2)
-            with st.spinner(f"{_model_display_name(MODEL_PRIMARY)}(이)가 에피소드 초안을 작성 중입니다..."):
-                draft = assistant.generate_draft(story_context, guide_text)
-                st.session_state.assistant_draft_result = draft
+            guide_text = st.session_state.get("assistant_guide_text", "")
+            placeholder = st.empty()
+            placeholder.caption(f"{_model_display_name(MODEL_PRIMARY)}(이)가 에피소드 초안을 작성 중입니다...")
+            draft = assistant.generate_draft(
+                story_context, guide_text,
+                on_delta=lambda text: placeholder.code(text, language="json"),
+            )
+            placeholder.empty()
+            st.session_state.assistant_draft_result = draft
 
         draft_result = st.session_state.get("assistant_draft_result")
         if draft_result:
@@ -283,6 +414,57 @@ def render_story_assistant(analytics_mgr: CustomerAnalyticsManager, data_mgr):
         st.info("먼저 '가이드 생성'을 실행한 후 초안을 생성할 수 있습니다.")
 
 
+@st.cache_data(ttl=600, show_spinner=False)
+def _collect_audience_summary(_analytics_mgr: CustomerAnalyticsManager) -> str:
+    """전체 사용자 대화 통계 요약 텍스트 (세션 간 공유, 10분 캐시)"""
+    users = _analytics_mgr.list_users()
+    audience_summary_parts = []
+
+    total_conversations = 0
+    char_counts = Counter()
+    sentiment_total = {"positive": 0, "neutral": 0, "negative": 0}
+    all_keywords = Counter()
+
+    # 집계에 필요한 대화 통계만 일괄 조회 (프로필/메모리/S3 로그 왕복 생략)
+    per_user = _analytics_mgr.batch_get_conversation_stats(
+        [u["user_id"] for u in users], max_workers=AUDIENCE_FETCH_WORKERS
+    )
+
+    for user_data in per_user.values():
+        total_conversations += user_data.get("conversation_count", 0)
+
+        char_counts += Counter(user_data.get("character_chat_counts", {}))
+
+        for sentiment, cnt in user_data.get("sentiment_distribution", {}).items():
+            sentiment_total[sentiment] = sentiment_total.get(sentiment, 0) + cnt
+
+        all_keywords.update(user_data.get("top_keywords", []))
+
+    # 요약 텍스트 생성
+    audience_summary_parts.append(f"총 사용자 수: {len(users)}")
+    audience_summary_parts.append(f"총 대화 수: {total_conversations}")
+
+    if char_counts:
+        sorted_chars = char_counts.most_common()
+        audience_summary_parts.append(
+            "캐릭터별 대화 수: " + ", ".join(f"{c}({n}회)" for c, n in sorted_chars)
+        )
+
+    total_sentiments = sum(sentiment_total.values())
+    if total_sentiments > 0:
+        audience_summary_parts.append(
+            "감정 분포: " + ", ".join(
+                f"{k}={round(v/total_sentiments*100)}%" for k, v in sentiment_total.items()
+            )
+        )
+
+    if all_keywords:
+        top_kw = [kw for kw, _ in all_keywords.most_common(15)]
+        audience_summary_parts.append(f"주요 키워드: {', '.join(top_kw)}")
+
+    return "\n".join(audience_summary_parts)
+
+
 def _build_story_context(content, content_id, data_mgr, episode_num, writer_notes) -> str:
     """스토리 컨텍스트 텍스트 구성"""
     parts = []
@@ -302,10 +484,7 @@ def _build_story_context(content, content_id, data_mgr, episode_num, writer_note
         parts.append(f"세계관: {world_setting[:500]}")
 
     # 캐릭터 정보
-    cache_key = f"assistant_chars_{content_id}"
-    if cache_key not in st.session_state:
-        st.session_state[cache_key] = data_mgr.list_characters(content_id)
-    characters = st.session_state[cache_key]
+    characters = cached_characters(data_mgr, content_id)
 
     if characters:
         char_lines = []
@@ -318,10 +497,7 @@ def _build_story_context(content, content_id, data_mgr, episode_num, writer_note
         parts.append("[캐릭터]\n" + "\n".join(char_lines))
 
     # 관계
-    rel_cache_key = f"assistant_rels_{content_id}"
-    if rel_cache_key not in st.session_state:
-        st.session_state[rel_cache_key] = data_mgr.list_relationships(content_id)
-    relationships = st.session_state[rel_cache_key]
+    relationships = cached_relationships(data_mgr, content_id)
 
     if relationships:
         rel_lines = []
@@ -363,7 +539,7 @@ def _display_guide_result(result: Dict[str, Any]):
         st.markdown(f"""
         <div class="stat-card" style="text-align:left; margin-bottom:1rem;">
             <h3 style="font-size:1rem;">전체 스토리 방향</h3>
-            <p style="font-size:0.95rem;">{direction}</p>
+            <p style="font-size:0.95rem;">{html.escape(str(direction))}</p>
         </div>
         """, unsafe_allow_html=True)
 
@@ -406,20 +582,24 @@ def _display_guide_result(result: Dict[str, Any]):
     if plots:
         st.markdown("**플롯 제안:**")
         if isinstance(plots, list):
+            # 카드 HTML을 모아 한 번에 전송 (LLM 출력은 escape)
+            html_parts = []
             for i, plot in enumerate(plots, 1):
                 if isinstance(plot, dict):
                     title = plot.get("title", plot.get("name", f"제안 {i}"))
                     overview = plot.get("overview", plot.get("description", plot.get("summary", "")))
                     effect = plot.get("expected_effect", plot.get("effect", ""))
-                    st.markdown(f"""
-                    <div class="stat-card" style="text-align:left; margin-bottom:0.5rem;">
-                        <h3 style="font-size:0.95rem;">{i}. {title}</h3>
-                        <p style="font-size:0.9rem;">{overview}</p>
-                        <p style="font-size:0.85rem; color:#7ec8e3 !important;">예상 효과: {effect}</p>
-                    </div>
-                    """, unsafe_allow_html=True)
+                    html_parts.append(
+                        f"<div class='stat-card' style='text-align:left; margin-bottom:0.5rem;'>"
+                        f"<h3 style='font-size:0.95rem;'>{i}. {html.escape(str(title))}</h3>"
+                        f"<p style='font-size:0.9rem;'>{html.escape(str(overview))}</p>"
+                        f"<p style='font-size:0.85rem; color:#7ec8e3 !important;'>예상 효과: {html.escape(str(effect))}</p>"
+                        f"</div>"
+                    )
                 else:
-                    st.write(f"{i}. {plot}")
+                    html_parts.append(f"<p>{i}. {html.escape(str(plot))}</p>")
+            # 들여쓰기 없는 한 줄 HTML로 이어 붙임 (st.markdown dedent 후 코드 블록으로 해석되지 않도록)
+            st.markdown("".join(html_parts), unsafe_allow_html=True)
 
     # 긴장감 포인트
     tensions = result.get("tension_points", [])
@@ -456,8 +636,8 @@ def _display_draft_result(result: Dict[str, Any]):
 
     st.markdown(f"""
     <div class="stat-card" style="text-align:left; margin-bottom:1rem;">
-        <h3 style="font-size:1.1rem;">{title}{model_badge}</h3>
-        <p style="font-size:0.95rem;">{summary}</p>
+        <h3 style="font-size:1.1rem;">{html.escape(str(title))}{model_badge}</h3>
+        <p style="font-size:0.95rem;">{html.escape(str(summary))}</p>
     </div>
     """, unsafe_allow_html=True)
 
@@ -474,38 +654,42 @@ def _display_draft_result(result: Dict[str, Any]):
         scenes = result.get("key_scenes", [])
         if scenes:
             with st.expander("주요 장면", expanded=True):
+                lines = []
                 for i, scene in enumerate(scenes, 1):
                     if isinstance(scene, dict):
                         scene_title = scene.get("title", scene.get("name", f"장면 {i}"))
                         desc = scene.get("description", scene.get("detail", ""))
                         chars = scene.get("characters", [])
                         chars_text = ", ".join(chars) if isinstance(chars, list) else str(chars)
-                        st.write(f"**{i}. {scene_title}**")
-                        st.write(f"  {desc}")
+                        lines.append(f"**{i}. {scene_title}**")
+                        lines.append(f"  {desc}")
                         if chars_text:
-                            st.write(f"  등장: {chars_text}")
+                            lines.append(f"  등장: {chars_text}")
                     else:
-                        st.write(f"{i}. {scene}")
+                        lines.append(f"{i}. {scene}")
+                st.markdown("\n\n".join(lines))
 
     with col2:
         # 캐릭터 하이라이트
         moments = result.get("character_moments", [])
         if moments:
             with st.expander("캐릭터 하이라이트", expanded=True):
+                lines = []
                 if isinstance(moments, list):
                     for m in moments:
                         if isinstance(m, dict):
                             char = m.get("character", m.get("name", ""))
                             moment = m.get("moment", m.get("key_moment", ""))
                             emotion = m.get("emotion_change", m.get("emotion", ""))
-                            st.write(f"**{char}**: {moment}")
+                            lines.append(f"**{char}**: {moment}")
                             if emotion:
-                                st.write(f"  감정 변화: {emotion}")
+                                lines.append(f"  감정 변화: {emotion}")
                         else:
-                            st.write(f"- {m}")
+                            lines.append(f"- {m}")
                 elif isinstance(moments, dict):
                     for char, info in moments.items():
-                        st.write(f"**{char}**: {info}")
+                        lines.append(f"**{char}**: {info}")
+                st.markdown("\n\n".join(lines))
 
     # 다음 에피소드 예고
     cliffhanger = result.get("cliffhanger", "")
@@ -514,6 +698,6 @@ def _display_draft_result(result: Dict[str, Any]):
         st.markdown(f"""
         <div class="stat-card" style="text-align:left;">
             <h3 style="font-size:0.95rem;">다음 에피소드 예고</h3>
-            <p style="font-size:0.95rem; color:#7ec8e3 !important;">{cliffhanger}</p>
+            <p style="font-size:0.95rem; color:#7ec8e3 !important;">{html.escape(str(cliffhanger))}</p>
         </div>
         """, unsafe_allow_html=True)
@@ -4,13 +4,55 @@
 AI 요약 분석 + 원본 데이터 열람
 """
 
+import hashlib
+import html
+import json
+import time
+
 import streamlit as st
-from typing import Dict, Any, List
+from typing import TYPE_CHECKING, Dict, Any, List
+
+from story_app_common import cards_row
+
+# 분석 모듈은 실제 사용 시점에 import (타입 힌트용으로만 참조)
+if TYPE_CHECKING:
+    from admin_app_analytics import CustomerAnalyticsManager
+
+
+# 감정 / 참여도 배지
+_SENTIMENT_BADGES = {"positive": "🟢", "neutral": "🟡", "negative": "🔴"}
+_ENGAGEMENT_BADGES = {"high": "🟢", "medium": "🟡", "low": "🔴"}
+
+# 대화 이력 페이지 크기 (더 보기 클릭 시 이만큼 추가 표시)
+CONV_PAGE_SIZE = 50
+
+# 전체 통계 디스크 캐시 버킷 (초) — 사용자 집합이 같아도 이 주기마다 재집계
+STATS_CACHE_BUCKET_SEC = 600
+
+
+# _mgr: 언더스코어 접두사 → Streamlit이 해시하지 않음 (user_id만 캐시 키, 세션·탭 간 공유)
+@st.cache_data(ttl=300, show_spinner=False)
+def _cached_user_full_data(user_id: str, _mgr: "CustomerAnalyticsManager") -> Dict[str, Any]:
+    return _mgr.get_user_full_data(user_id)
+
 
-from admin_app_analytics import CustomerAnalyticsManager, _model_display_name, MODEL_PRIMARY
+def _stats_fingerprint(users: List[Dict[str, Any]]) -> str:
+    """(정렬된 user_id 목록, 시간 버킷) → 캐시 키"""
+    user_ids = sorted(u["user_id"] for u in users)
+    bucket = int(time.time() // STATS_CACHE_BUCKET_SEC)
+    return hashlib.sha256(json.dumps([user_ids, bucket]).encode()).hexdigest()
 
 
-def render_audience_insights(analytics_mgr: CustomerAnalyticsManager, data_mgr):
+# 프로세스 재시작·세션 간에도 동일 사용자 집합이면 집계 결과 재사용
+# (disk 캐시는 ttl이 무시되고 키에 시간 버킷이 포함되므로 max_entries로 오래된 항목 제거)
+@st.cache_data(persist="disk", max_entries=8, show_spinner=False)
+def _aggregate_stats(fingerprint: str, _user_ids: List[str], _mgr: "CustomerAnalyticsManager") -> Dict[str, Any]:
+    stats = _mgr.get_users_aggregate_counts(_user_ids)
+    stats["total_users"] = len(_user_ids)
+    return stats
+
+
+def render_audience_insights(analytics_mgr: "CustomerAnalyticsManager", data_mgr):
     """고객 반응 분석 페이지"""
 
     st.markdown("""
@@ -30,21 +72,35 @@ def render_audience_insights(analytics_mgr: CustomerAnalyticsManager, data_mgr):
         _render_raw_data_tab(analytics_mgr)
 
 
+def _ensure_users_loaded(analytics_mgr: "CustomerAnalyticsManager"):
+    """사용자 목록 + {표시 라벨: user_id}를 로드 시 1회 구성 (두 탭 공유)"""
+    if "story_users" not in st.session_state:
+        with st.spinner("사용자 목록 로딩 중..."):
+            users = analytics_mgr.list_users()
+        st.session_state.story_users = users
+        st.session_state.story_user_options = {
+            f"{u.get('nickname') or u.get('display_name') or u['user_id']} ({u.get('email', '')})": u["user_id"]
+            for u in users
+        }
+
+
 # ═══════════════════════════════════════════════════════════════
 # 탭 1: 반응 요약 (AI 분석)
 # ═══════════════════════════════════════════════════════════════
 
-def _render_summary_tab(analytics_mgr: CustomerAnalyticsManager, data_mgr):
+# 탭 내부 위젯 조작 시 해당 탭만 재실행 (다른 탭·헤더는 건너뜀)
+@st.fragment
+def _render_summary_tab(analytics_mgr: "CustomerAnalyticsManager", data_mgr):
     """AI 분석 기반 고객 반응 요약"""
 
     # 사용자 목록 로드
     if st.button("사용자 목록 새로고침", key="story_refresh_users"):
         st.session_state.pop("story_users", None)
+        st.session_state.pop("story_user_options", None)
+        _cached_user_full_data.clear()
+        _aggregate_stats.clear()
 
-    if "story_users" not in st.session_state:
-        with st.spinner("사용자 목록 로딩 중..."):
-            st.session_state.story_users = analytics_mgr.list_users()
-
+    _ensure_users_loaded(analytics_mgr)
     users = st.session_state.story_users
     if not users:
         st.warning("등록된 사용자가 없습니다.")
@@ -58,18 +114,17 @@ def _render_summary_tab(analytics_mgr: CustomerAnalyticsManager, data_mgr):
     # ── 개별 사용자 AI 분석 ──
     st.subheader("개별 사용자 AI 분석")
 
-    user_options = {
-        f"{u.get('nickname') or u.get('display_name') or u['user_id']} ({u.get('email', '')})": u["user_id"]
-        for u in users
-    }
+    user_options = st.session_state.story_user_options
     selected_label = st.selectbox(
         "분석할 사용자 선택", list(user_options.keys()), key="story_pref_user"
     )
     selected_user_id = user_options[selected_label]
 
     if st.button("데이터 로드 + AI 분석", key="story_load_analyze"):
+        from admin_app_analytics import _model_display_name, MODEL_PRIMARY
+
         with st.spinner("사용자 데이터 수집 중..."):
-            user_data = analytics_mgr.get_user_full_data(selected_user_id)
+            user_data = _cached_user_full_data(selected_user_id, analytics_mgr)
             st.session_state.story_user_data = user_data
 
         with st.spinner(f"{_model_display_name(MODEL_PRIMARY)}(이)가 분석 중입니다..."):
@@ -81,102 +136,52 @@ def _render_summary_tab(analytics_mgr: CustomerAnalyticsManager, data_mgr):
         _display_story_analysis(result)
 
 
-def _render_overall_stats(analytics_mgr: CustomerAnalyticsManager, users: list):
+def _render_overall_stats(analytics_mgr: "CustomerAnalyticsManager", users: list):
     """전체 사용자 대화 통계 요약"""
 
     st.subheader("전체 대화 통계")
 
     if st.button("통계 집계", key="story_aggregate_stats"):
         with st.spinner("전체 사용자 데이터 집계 중..."):
-            total_conversations = 0
-            char_total_counts = {}
-            sentiment_total = {"positive": 0, "neutral": 0, "negative": 0}
-
-            for user in users:
-                user_data = analytics_mgr.get_user_full_data(user["user_id"])
-                total_conversations += user_data.get("conversation_count", 0)
-
-                for char, cnt in user_data.get("character_chat_counts", {}).items():
-                    char_total_counts[char] = char_total_counts.get(char, 0) + cnt
-
-                for sentiment, cnt in user_data.get("sentiment_distribution", {}).items():
-                    sentiment_total[sentiment] = sentiment_total.get(sentiment, 0) + cnt
-
-            st.session_state.story_overall_stats = {
-                "total_users": len(users),
-                "total_conversations": total_conversations,
-                "character_counts": char_total_counts,
-                "sentiment_total": sentiment_total,
-            }
+            # 대화 통계만 일괄 조회 후 매니저에서 합산 (사용자별 전체 데이터 로드 생략)
+            st.session_state.story_overall_stats = _aggregate_stats(
+                _stats_fingerprint(users), [u["user_id"] for u in users], analytics_mgr
+            )
 
     stats = st.session_state.get("story_overall_stats")
     if not stats:
         st.info("'통계 집계' 버튼을 클릭하면 전체 사용자 대화 데이터를 집계합니다.")
         return
 
-    # 통계 카드
-    col1, col2 = st.columns(2)
-    with col1:
-        st.markdown(f"""
-        <div class="stat-card">
-            <h3>{stats['total_users']}</h3>
-            <p>총 사용자 수</p>
-        </div>
-        """, unsafe_allow_html=True)
-    with col2:
-        st.markdown(f"""
-        <div class="stat-card">
-            <h3>{stats['total_conversations']}</h3>
-            <p>총 대화 수</p>
-        </div>
-        """, unsafe_allow_html=True)
+    # 통계 카드 (행 단위로 한 번에 전송)
+    st.markdown(cards_row([
+        (stats["total_users"], "총 사용자 수"),
+        (stats["total_conversations"], "총 대화 수"),
+    ]), unsafe_allow_html=True)
 
     # 캐릭터별 대화 수
     char_counts = stats.get("character_counts", {})
     if char_counts:
         st.markdown("**캐릭터별 대화 수:**")
         sorted_chars = sorted(char_counts.items(), key=lambda x: -x[1])
-        cols = st.columns(min(len(sorted_chars), 5))
-        for i, (char, cnt) in enumerate(sorted_chars):
-            with cols[i % 5]:
-                st.markdown(f"""
-                <div class="stat-card">
-                    <h3>{cnt}</h3>
-                    <p>{char}</p>
-                </div>
-                """, unsafe_allow_html=True)
+        st.markdown(cards_row(
+            [(cnt, char) for char, cnt in sorted_chars],
+            columns=min(len(sorted_chars), 5),
+        ), unsafe_allow_html=True)
 
     # 감정 분포
     sentiment = stats.get("sentiment_total", {})
     if sentiment:
-        total = sum(sentiment.values())
+        pos, neu, neg = (sentiment.get(k, 0) for k in ("positive", "neutral", "negative"))
+        total = pos + neu + neg
         if total > 0:
+            pos_pct, neu_pct, neg_pct = (round(v * 100 / total) for v in (pos, neu, neg))
             st.markdown("**전체 감정 분포:**")
-            col_a, col_b, col_c = st.columns(3)
-            with col_a:
-                pct = round(sentiment.get("positive", 0) / total * 100)
-                st.markdown(f"""
-                <div class="stat-card">
-                    <h3>{pct}%</h3>
-                    <p>긍정</p>
-                </div>
-                """, unsafe_allow_html=True)
-            with col_b:
-                pct = round(sentiment.get("neutral", 0) / total * 100)
-                st.markdown(f"""
-                <div class="stat-card">
-                    <h3>{pct}%</h3>
-                    <p>중립</p>
-                </div>
-                """, unsafe_allow_html=True)
-            with col_c:
-                pct = round(sentiment.get("negative", 0) / total * 100)
-                st.markdown(f"""
-                <div class="stat-card">
-                    <h3>{pct}%</h3>
-                    <p>부정</p>
-                </div>
-                """, unsafe_allow_html=True)
+            st.markdown(cards_row([
+                (f"{pos_pct}%", "긍정"),
+                (f"{neu_pct}%", "중립"),
+                (f"{neg_pct}%", "부정"),
+            ]), unsafe_allow_html=True)
 
 
 def _display_story_analysis(result: Dict[str, Any]):
@@ -254,7 +259,7 @@ def _display_story_analysis(result: Dict[str, Any]):
         if isinstance(engagement, dict):
             level = engagement.get("level", engagement.get("engagement", ""))
             reason = engagement.get("reason", engagement.get("evidence", ""))
-            badge = {"high": "🟢", "medium": "🟡", "low": "🔴"}.get(str(level).lower(), "⚪")
+            badge = _ENGAGEMENT_BADGES.get(str(level).lower(), "⚪")
             st.markdown(f"**참여도:** {badge} {level}  —  {reason}")
         else:
             st.markdown(f"**참여도:** {engagement}")
@@ -264,23 +269,18 @@ def _display_story_analysis(result: Dict[str, Any]):
 # 탭 2: 원본 데이터
 # ═══════════════════════════════════════════════════════════════
 
-def _render_raw_data_tab(analytics_mgr: CustomerAnalyticsManager):
+@st.fragment
+def _render_raw_data_tab(analytics_mgr: "CustomerAnalyticsManager"):
     """원본 데이터 열람"""
 
     # 사용자 목록 (탭 1과 공유)
-    if "story_users" not in st.session_state:
-        with st.spinner("사용자 목록 로딩 중..."):
-            st.session_state.story_users = analytics_mgr.list_users()
-
+    _ensure_users_loaded(analytics_mgr)
     users = st.session_state.story_users
     if not users:
         st.warning("등록된 사용자가 없습니다.")
         return
 
-    user_options = {
-        f"{u.get('nickname') or u.get('display_name') or u['user_id']} ({u.get('email', '')})": u["user_id"]
-        for u in users
-    }
+    user_options = st.session_state.story_user_options
     selected_label = st.selectbox(
         "사용자 선택", list(user_options.keys()), key="story_raw_user"
     )
@@ -288,7 +288,12 @@ def _render_raw_data_tab(analytics_mgr: CustomerAnalyticsManager):
 
     if st.button("원본 데이터 로드", key="story_load_raw"):
         with st.spinner("사용자 데이터 수집 중..."):
-            st.session_state.story_raw_data = analytics_mgr.get_user_full_data(selected_user_id)
+            raw_data = _cached_user_full_data(selected_user_id, analytics_mgr)
+            # 표시용 집계는 로드 시 1회 계산 (cache_data 반환값은 사본이라 수정 안전)
+            raw_data["_memories_total"] = sum(
+                len(v) for v in raw_data.get("memories_by_category", {}).values()
+            )
+            st.session_state.story_raw_data = raw_data
 
     raw_data = st.session_state.get("story_raw_data")
     if not raw_data:
@@ -319,30 +324,42 @@ def _render_raw_data_tab(analytics_mgr: CustomerAnalyticsManager):
         else:
             st.info("프로필 데이터 없음")
 
+    # 접힌 섹션은 토글을 켤 때만 본문 생성 (expander는 접혀 있어도 전체를 렌더링)
+    uid = raw_data.get("user_id", "")
+
     # 대화 이력
     conversations = raw_data.get("conversations", [])
-    with st.expander(f"대화 이력 ({len(conversations)}건)", expanded=False):
+    if st.toggle(f"대화 이력 ({len(conversations)}건)", key=f"story_show_conv_{uid}"):
         if conversations:
-            for conv in conversations:
-                char = conv.get("character", "")
-                summary = conv.get("summary", "")
+            page_key = f"story_conv_shown_{uid}"
+            shown = st.session_state.get(page_key, CONV_PAGE_SIZE)
+            # 대화별 HTML을 모아 한 번에 전송 (사용자 데이터는 escape)
+            html_parts = []
+            for conv in conversations[:shown]:
+                char = html.escape(str(conv.get("character", "")))
+                summary = html.escape(str(conv.get("summary", "")))
                 sentiment = conv.get("user_sentiment", "")
                 keywords = conv.get("keywords", [])
                 msg_count = conv.get("message_count", 0)
-                session_start = conv.get("session_start", "")[:16]
-
-                badge = {"positive": "🟢", "neutral": "🟡", "negative": "🔴"}.get(sentiment, "⚪")
-                st.markdown(f"**{char}** ({session_start}) — {badge} {sentiment} — {msg_count}개 메시지")
-                st.write(f"요약: {summary}")
-                if keywords:
-                    st.write(f"키워드: {', '.join(keywords)}")
-                st.markdown("---")
+                session_start = html.escape(conv.get("session_start", "")[:16])
+
+                badge = _SENTIMENT_BADGES.get(sentiment, "⚪")
+                kw_line = f"<br>키워드: {html.escape(', '.join(keywords))}" if keywords else ""
+                html_parts.append(
+                    f"<p><b>{char}</b> ({session_start}) — {badge} {html.escape(str(sentiment))} — {msg_count}개 메시지"
+                    f"<br>요약: {summary}{kw_line}</p><hr>"
+                )
+            st.markdown("\n".join(html_parts), unsafe_allow_html=True)
+            if len(conversations) > shown:
+                if st.button(f"다음 {CONV_PAGE_SIZE}건 ({shown}/{len(conversations)})", key=f"{page_key}_more"):
+                    st.session_state[page_key] = shown + CONV_PAGE_SIZE
+                    st.rerun(scope="fragment")
         else:
             st.info("대화 이력 없음")
 
     # 장기 기억
     memories_by_cat = raw_data.get("memories_by_category", {})
-    with st.expander(f"장기 기억 ({sum(len(v) for v in memories_by_cat.values())}건)", expanded=False):
+    if st.toggle(f"장기 기억 ({raw_data.get('_memories_total', 0)}건)", key=f"story_show_mem_{uid}"):
         if memories_by_cat:
             for cat, items in memories_by_cat.items():
                 st.markdown(f"**[{cat}]** ({len(items)}건)")
@@ -355,22 +372,22 @@ def _render_raw_data_tab(analytics_mgr: CustomerAnalyticsManager):
 
     # 최근 대화 로그
     recent_logs = raw_data.get("recent_logs", [])
-    with st.expander(f"최근 대화 로그 ({len(recent_logs)}건)", expanded=False):
+    if st.toggle(f"최근 대화 로그 ({len(recent_logs)}건)", key=f"story_show_logs_{uid}"):
         if recent_logs:
+            html_parts = []
             for log in recent_logs:
-                char = log.get("character", "")
-                session_start = log.get("session_start", "")[:16]
+                char = html.escape(str(log.get("character", "")))
+                session_start = html.escape(log.get("session_start", "")[:16])
                 msg_count = log.get("message_count", 0)
-                st.markdown(f"**{char}** ({session_start}) — {msg_count}개 메시지")
+                html_parts.append(f"<p><b>{char}</b> ({session_start}) — {msg_count}개 메시지</p>")
 
                 messages = log.get("messages", [])
                 for msg in messages:
-                    role = msg.get("role", "")
-                    content = msg.get("content", "")
-                    if role == "user":
-                        st.markdown(f"> **사용자:** {content}")
-                    else:
-                        st.markdown(f"> **{char}:** {content}")
-                st.markdown("---")
+                    speaker = "사용자" if msg.get("role", "") == "user" else char
+                    html_parts.append(
+                        f"<blockquote><b>{speaker}:</b> {html.escape(str(msg.get('content', '')))}</blockquote>"
+                    )
+                html_parts.append("<hr>")
+            st.markdown("\n".join(html_parts), unsafe_allow_html=True)
         else:
             st.info("최근 대화 로그 없음")
@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+스토리보드 어시스턴트 앱 - 페이지 공용 헬퍼
+콘텐츠 / 캐릭터 / 관계 데이터 캐시 로더 + stat-card HTML (페이지 모듈 공유)
+"""
+
+import html
+
+import streamlit as st
+from typing import Dict, Any, List
+
+
+# _data_mgr: 언더스코어 접두사 → Streamlit이 해시하지 않음 (content_id만 캐시 키, 세션 간 공유)
+@st.cache_data(ttl=300, show_spinner=False)
+def cached_contents(_data_mgr) -> List[Dict[str, Any]]:
+    return _data_mgr.list_contents()
+
+
+@st.cache_data(ttl=300, max_entries=64, show_spinner=False)
+def cached_characters(_data_mgr, content_id: str) -> List[Dict[str, Any]]:
+    return _data_mgr.list_characters(content_id)
+
+
+@st.cache_data(ttl=300, max_entries=64, show_spinner=False)
+def cached_relationships(_data_mgr, content_id: str) -> List[Dict[str, Any]]:
+    return _data_mgr.list_relationships(content_id)
+
+
+def clear_story_caches():
+    """콘텐츠 / 캐릭터 / 관계 캐시 전체 무효화 (새로고침 버튼)"""
+    cached_contents.clear()
+    cached_characters.clear()
+    cached_relationships.clear()
+
+
+def cards_row(cells, columns: int = 0) -> str:
+    """[(값, 라벨), ...] → stat-card 그리드 HTML 한 덩어리 (값·라벨은 escape, columns 초과 시 줄바꿈)"""
+    cards = "".join(
+        f"<div class='stat-card'><h3>{html.escape(str(h))}</h3><p>{html.escape(str(p))}</p></div>"
+        for h, p in cells
+    )
+    return (
+        f"<div style='display:grid; grid-template-columns:repeat({columns or len(cells)}, 1fr); gap:1rem;'>"
+        f"{cards}</div>"
+    )
@@ -4,9 +4,21 @@
 콘텐츠 정보, 캐릭터 맵, 세계관, 작가 메모 관리
 """
 
+import html
+
 import streamlit as st
 from typing import Dict, Any, List
 
+from story_app_common import cached_characters, cached_relationships, cards_row, clear_story_caches
+
+# role_type → 표시 라벨
+_ROLE_LABELS = {
+    "protagonist": "주인공",
+    "antagonist": "악역",
+    "supporting": "조연",
+    "mentor": "멘토",
+}
+
 
 def render_story_dashboard(data_mgr):
     """스토리 현황 대시보드 페이지"""
@@ -22,8 +34,12 @@ def render_story_dashboard(data_mgr):
     if "story_contents" not in st.session_state:
         with st.spinner("콘텐츠 목록 로딩 중..."):
             st.session_state.story_contents = data_mgr.list_contents()
+            st.session_state.story_contents_by_id = {
+                c["content_id"]: c for c in st.session_state.story_contents
+            }
 
     contents = st.session_state.story_contents
+    contents_by_id = st.session_state.story_contents_by_id
     if not contents:
         st.warning("등록된 콘텐츠가 없습니다. 관리자 앱에서 콘텐츠를 먼저 등록해주세요.")
         return
@@ -32,8 +48,8 @@ def render_story_dashboard(data_mgr):
     col_select, col_refresh = st.columns([4, 1])
     with col_select:
         content_options = {
-            f"{c.get('title', '')} ({c.get('title_en', '')})": c["content_id"]
-            for c in contents
+            f"{c.get('title', '')} ({c.get('title_en', '')})": cid
+            for cid, c in contents_by_id.items()
         }
         selected_label = st.selectbox(
             "콘텐츠 선택", list(content_options.keys()), key="story_content_select"
@@ -43,23 +59,16 @@ def render_story_dashboard(data_mgr):
         st.markdown("<br>", unsafe_allow_html=True)
         if st.button("새로고침", key="refresh_story_contents"):
             st.session_state.pop("story_contents", None)
-            st.session_state.pop("story_characters", None)
-            st.session_state.pop("story_relationships", None)
+            st.session_state.pop("story_contents_by_id", None)
+            clear_story_caches()
             st.rerun()
 
     # ── 선택한 콘텐츠 데이터 로드 ──
-    content = next((c for c in contents if c["content_id"] == content_id), {})
-
-    cache_key_chars = f"story_chars_{content_id}"
-    cache_key_rels = f"story_rels_{content_id}"
+    content = contents_by_id.get(content_id, {})
 
-    if cache_key_chars not in st.session_state:
-        with st.spinner("캐릭터 데이터 로딩 중..."):
-            st.session_state[cache_key_chars] = data_mgr.list_characters(content_id)
-            st.session_state[cache_key_rels] = data_mgr.list_relationships(content_id)
-
-    characters = st.session_state[cache_key_chars]
-    relationships = st.session_state[cache_key_rels]
+    with st.spinner("캐릭터 데이터 로딩 중..."):
+        characters = cached_characters(data_mgr, content_id)
+        relationships = cached_relationships(data_mgr, content_id)
 
     # ── 1. 콘텐츠 기본 정보 ──
     _render_content_info(content, characters, relationships)
@@ -85,38 +94,15 @@ def _render_content_info(content: Dict[str, Any], characters: list, relationship
 
     st.subheader("작품 개요")
 
-    # 통계 카드
-    col1, col2, col3, col4 = st.columns(4)
-    with col1:
-        st.markdown(f"""
-        <div class="stat-card">
-            <h3>{content.get('title', '-')}</h3>
-            <p>작품명</p>
-        </div>
-        """, unsafe_allow_html=True)
-    with col2:
-        genres = content.get("genre", [])
-        genre_text = ", ".join(genres) if genres else "-"
-        st.markdown(f"""
-        <div class="stat-card">
-            <h3>{genre_text}</h3>
-            <p>장르</p>
-        </div>
-        """, unsafe_allow_html=True)
-    with col3:
-        st.markdown(f"""
-        <div class="stat-card">
-            <h3>{len(characters)}</h3>
-            <p>등록 캐릭터</p>
-        </div>
-        """, unsafe_allow_html=True)
-    with col4:
-        st.markdown(f"""
-        <div class="stat-card">
-            <h3>{len(relationships)}</h3>
-            <p>관계 설정</p>
-        </div>
-        """, unsafe_allow_html=True)
+    # 통계 카드 (4장을 한 번에 전송)
+    genres = content.get("genre", [])
+    genre_text = ", ".join(genres) if genres else "-"
+    st.markdown(cards_row([
+        (content.get("title", "-"), "작품명"),
+        (genre_text, "장르"),
+        (len(characters), "등록 캐릭터"),
+        (len(relationships), "관계 설정"),
+    ]), unsafe_allow_html=True)
 
     # 시놉시스
     synopsis = content.get("synopsis", "")
@@ -159,39 +145,32 @@ def _render_character_map(characters: List[Dict[str, Any]], relationships: List[
 
     # 역할별 분류
     role_groups = {}
-    role_labels = {
-        "protagonist": "주인공",
-        "antagonist": "악역",
-        "supporting": "조연",
-        "mentor": "멘토",
-    }
     for char in characters:
         role = char.get("role_type", "supporting")
-        label = role_labels.get(role, role)
-        if label not in role_groups:
-            role_groups[label] = []
-        role_groups[label].append(char)
+        label = _ROLE_LABELS.get(role, role)
+        role_groups.setdefault(label, []).append(char)
 
-    # 역할별 표시
+    # 역할별 표시 (그룹별 카드를 4열 그리드 HTML 하나로 모아 전송)
     for role_label, chars in role_groups.items():
-        st.markdown(f"**{role_label}** ({len(chars)}명)")
-        cols = st.columns(min(len(chars), 4))
-        for i, char in enumerate(chars):
-            with cols[i % 4]:
-                name = char.get("name", "")
-                name_en = char.get("name_en", "")
-                emoji = char.get("emoji", "")
-                group = char.get("group", "")
-                traits = char.get("personality_traits", [])
-                traits_text = ", ".join(traits[:3]) if traits else "-"
-
-                st.markdown(f"""
-                <div class="stat-card" style="text-align:left; margin-bottom:0.5rem;">
-                    <h3 style="font-size:1rem;">{emoji} {name} ({name_en})</h3>
-                    <p><b>그룹:</b> {group or '-'}</p>
-                    <p><b>성격:</b> {traits_text}</p>
-                </div>
-                """, unsafe_allow_html=True)
+        cards = []
+        for char in chars:
+            name = html.escape(str(char.get("name", "")))
+            name_en = html.escape(str(char.get("name_en", "")))
+            emoji = html.escape(str(char.get("emoji", "")))
+            group = html.escape(str(char.get("group", "") or "-"))
+            traits = char.get("personality_traits", [])
+            traits_text = html.escape(", ".join(traits[:3])) if traits else "-"
+            cards.append(
+                f"<div class='stat-card' style='text-align:left; margin-bottom:0.5rem;'>"
+                f"<h3 style='font-size:1rem;'>{emoji} {name} ({name_en})</h3>"
+                f"<p><b>그룹:</b> {group}</p><p><b>성격:</b> {traits_text}</p></div>"
+            )
+        st.markdown(
+            f"<p><b>{html.escape(str(role_label))}</b> ({len(chars)}명)</p>"
+            f"<div style='display:grid; grid-template-columns:repeat({min(len(chars), 4)}, 1fr); gap:1rem;'>"
+            + "".join(cards) + "</div>",
+            unsafe_allow_html=True,
+        )
 
     # 관계 요약
     if relationships:
@@ -224,15 +203,21 @@ def _render_story_notes(content_id: str):
     st.caption("작가님의 메모를 자유롭게 작성하세요. (세션 내 유지)")
 
     notes_key = f"story_notes_{content_id}"
-    if notes_key not in st.session_state:
-        st.session_state[notes_key] = ""
+    input_key = f"story_notes_input_{content_id}"
+    # 위젯 key에 직접 바인딩 — 위젯 상태는 페이지 이동 시 정리되므로 원본은 notes_key에 두고 변경 시에만 동기화
+    if input_key not in st.session_state:
+        st.session_state[input_key] = st.session_state.get(notes_key, "")
 
-    notes = st.text_area(
+    st.text_area(
         "스토리 메모",
-        value=st.session_state[notes_key],
         height=200,
-        key=f"story_notes_input_{content_id}",
+        key=input_key,
+        on_change=_save_story_notes,
+        args=(notes_key, input_key),
         placeholder="예: 다음 에피소드에서 루미의 마족 혈통이 드러나는 장면 구상 중...",
         label_visibility="collapsed",
     )
-    st.session_state[notes_key] = notes
+
+
+def _save_story_notes(notes_key: str, input_key: str):
+    st.session_state[notes_key] = st.session_state[input_key]